@@ -0,0 +1,233 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import comb, prod
+
+import numpy as np
+
+from careers import CareerRegistry
+from features import CAT_FIELDS, MULTI_FIELDS, QUESTION_CHOICES
+
+TABLE_DIR = 'answer_table'
+CHUNK_ROWS = 1 << 15
+
+
+class AnswerSpace:
+    """Dense numbering of every answer the main_quiz form can submit.
+
+    The categorical answers form a mixed-radix number; each multi-select is ranked among
+    all subsets of 1..max_picks items with the combinatorial number system. The flat index
+    is (categorical, interests, strengths) in row-major order, so encoding is O(1).
+    """
+
+    def __init__(self, interests, strengths, max_interests=1, max_strengths=1, choices=QUESTION_CHOICES):
+        self.choices = {key: list(choices[key]) for key in CAT_FIELDS}
+        self.vocab = {'interests': list(interests), 'strengths': list(strengths)}
+        self.max_picks = {'interests': max_interests, 'strengths': max_strengths}
+        self.position = {key: {v: i for i, v in enumerate(vals)}
+                         for key, vals in list(self.choices.items()) + list(self.vocab.items())}
+        self.radix = [len(self.choices[key]) for key in CAT_FIELDS]
+        self.n_subsets = {key: sum(comb(len(self.vocab[key]), j) for j in range(1, self.max_picks[key] + 1))
+                          for key in MULTI_FIELDS}
+        self.size = prod(self.radix) * self.n_subsets['interests'] * self.n_subsets['strengths']
+        self._subsets = {}
+
+    def subset_rank(self, key, picks):
+        n = len(self.vocab[key])
+        offset = sum(comb(n, j) for j in range(1, len(picks)))
+        return offset + sum(comb(c, i + 1) for i, c in enumerate(sorted(picks)))
+
+    def subsets(self, key):
+        """Item positions of every subset in rank order, padded with -1 to max_picks columns."""
+        n, m = len(self.vocab[key]), self.max_picks[key]
+        out = np.full((self.n_subsets[key], m), -1, dtype=np.intp)
+        binom = np.array([[comb(c, i) for i in range(m + 1)] for c in range(n)], dtype=np.int64)
+        offset = 0
+        for k in range(1, m + 1):
+            picks = np.array(list(combinations(range(n), k)), dtype=np.intp).reshape(-1, k)
+            ranks = offset + binom[picks, np.arange(1, k + 1)].sum(axis=1)
+            out[ranks, :k] = picks
+            offset += comb(n, k)
+        return out
+
+    def index(self, profile):
+        """Flat index of a profile, or None when it falls outside the tabulated space."""
+        idx = 0
+        for key, radix in zip(CAT_FIELDS, self.radix):
+            pos = self.position[key].get(profile.get(key))
+            if pos is None:
+                return None
+            idx = idx * radix + pos
+        for key in MULTI_FIELDS:
+            picks = {self.position[key].get(v) for v in profile.get(key, ())}
+            if not picks or None in picks or len(picks) > self.max_picks[key]:
+                return None
+            idx = idx * self.n_subsets[key] + self.subset_rank(key, picks)
+        return idx
+
+    def decode(self, idx):
+        idx, s = divmod(int(idx), self.n_subsets['strengths'])
+        idx, i = divmod(idx, self.n_subsets['interests'])
+        profile = {}
+        for key, radix in reversed(list(zip(CAT_FIELDS, self.radix))):
+            idx, pos = divmod(idx, radix)
+            profile[key] = self.choices[key][pos]
+        for key, rank in (('interests', i), ('strengths', s)):
+            if key not in self._subsets:
+                self._subsets[key] = self.subsets(key)
+            profile[key] = [self.vocab[key][p] for p in self._subsets[key][rank] if p >= 0]
+        return profile
+
+    def meta(self):
+        return {'choices': self.choices, 'interests': self.vocab['interests'], 'strengths': self.vocab['strengths'],
+                'max_interests': self.max_picks['interests'], 'max_strengths': self.max_picks['strengths']}
+
+    @classmethod
+    def from_meta(cls, meta):
+        return cls(meta['interests'], meta['strengths'], meta['max_interests'], meta['max_strengths'], meta['choices'])
+
+
+# --- 1. BUILD (one process per core) ---
+_worker = {}
+
+
+def _init_worker(model_path, space_meta):
+    from scoring import load_bundle
+    bundle = load_bundle(model_path)
+    space = AnswerSpace.from_meta(space_meta)
+    lookup = bundle['encoder'].lookup
+    # Feature column of every categorical option / vocabulary item; -1 lands in a scratch column
+    cat_cols = [np.array([lookup[key].get(v, -1) for v in space.choices[key]]) for key in CAT_FIELDS]
+    pick_cols = {}
+    for key in MULTI_FIELDS:
+        cols = np.array([lookup[key].get(v, -1) for v in space.vocab[key]] + [-1])
+        pick_cols[key] = cols[space.subsets(key)]
+    _worker.update(bundle=bundle, space=space, cat_cols=cat_cols, pick_cols=pick_cols)
+
+
+def _score_range(start, stop, k):
+    from scoring import predict_proba, rank_probabilities
+    bundle, space = _worker['bundle'], _worker['space']
+    idx = np.arange(start, stop)
+    rows = np.arange(len(idx))[:, np.newaxis]
+    X = np.zeros((len(idx), len(bundle['features']) + 1), dtype=np.float32)
+
+    idx, s = np.divmod(idx, space.n_subsets['strengths'])
+    idx, i = np.divmod(idx, space.n_subsets['interests'])
+    X[rows, _worker['pick_cols']['strengths'][s]] = 1
+    X[rows, _worker['pick_cols']['interests'][i]] = 1
+    for cols, radix in reversed(list(zip(_worker['cat_cols'], space.radix))):
+        idx, pos = np.divmod(idx, radix)
+        X[rows[:, 0], cols[pos]] = 1
+
+    ranked = rank_probabilities(predict_proba(bundle['model'], X[:, :-1]), k)
+    return start, ranked['id'], np.rint(ranked['score'] * 10).astype(np.uint16)
+
+
+def build_table(model_path=None, out=TABLE_DIR, max_interests=1, max_strengths=1, k=3, workers=None):
+    from scoring import default_model_path, load_bundle
+    model_path = model_path or default_model_path()
+    bundle = load_bundle(model_path)
+    space = AnswerSpace(bundle['mlb_int'].classes_.tolist(), bundle['mlb_str'].classes_.tolist(),
+                        max_interests, max_strengths)
+    classes = bundle['le'].classes_.tolist()
+    id_dtype = np.uint8 if len(classes) <= 256 else np.uint16
+
+    os.makedirs(out, exist_ok=True)
+    ids = np.lib.format.open_memmap(os.path.join(out, 'ids.npy'), mode='w+', dtype=id_dtype, shape=(space.size, k))
+    scores = np.lib.format.open_memmap(os.path.join(out, 'scores.npy'), mode='w+', dtype=np.uint16,
+                                       shape=(space.size, k))
+    starts = range(0, space.size, CHUNK_ROWS)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_path, space.meta())) as pool:
+        jobs = [pool.submit(_score_range, start, min(start + CHUNK_ROWS, space.size), k) for start in starts]
+        for job in jobs:
+            start, chunk_ids, chunk_scores = job.result()
+            ids[start:start + len(chunk_ids)] = chunk_ids
+            scores[start:start + len(chunk_ids)] = chunk_scores
+    ids.flush()
+    scores.flush()
+
+    meta = dict(space.meta(), k=k, classes=classes, model_version=bundle['version'], model_path=model_path)
+    with open(os.path.join(out, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    return space
+
+
+# --- 2. O(1) SERVING ---
+class AnswerTable:
+    """Memory-mapped top-k rankings for every answer in an AnswerSpace; no model needed."""
+
+    def __init__(self, path=TABLE_DIR):
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.space = AnswerSpace.from_meta(self.meta)
+        self.careers = CareerRegistry(self.meta['classes'])
+        self.model_version = self.meta['model_version']
+        self.ids = np.load(os.path.join(path, 'ids.npy'), mmap_mode='r')
+        self.scores = np.load(os.path.join(path, 'scores.npy'), mmap_mode='r')
+
+    def lookup(self, profile):
+        """Ranking in the score_profiles format, or None if the profile was not tabulated."""
+        idx = self.space.index(profile)
+        if idx is None:
+            return None
+        return [{"id": c, "career": self.careers[c], "score": s / 10}
+                for c, s in zip(self.ids[idx].tolist(), self.scores[idx].tolist())]
+
+
+def verify(path=TABLE_DIR, samples=1000, seed=0, model_path=None):
+    """Re-score random rows with the model the table was built from (its recorded path by default)."""
+    from scoring import load_bundle, default_model_path, score_profiles
+    table = AnswerTable(path)
+    bundle = load_bundle(model_path or table.meta.get('model_path') or default_model_path())
+    if bundle['version'] != table.model_version:
+        raise ValueError(f"{path} was built from {table.model_version}, not {bundle['version']}; "
+                         f"rebuild it or pass the model it was built from")
+    rng = np.random.default_rng(seed)
+    profiles = [table.space.decode(i) for i in rng.integers(0, table.space.size, samples)]
+    live = score_profiles(profiles, bundle, k=table.meta['k'])
+    mismatches = sum(table.lookup(p) != ranking for p, ranking in zip(profiles, live))
+    return len(profiles), mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute rankings for the enumerable answer space.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    bld = sub.add_parser('build')
+    bld.add_argument('--model', help="career_model.pkl or an artifact directory (default: auto)")
+    bld.add_argument('--out', default=TABLE_DIR)
+    bld.add_argument('--max-interests', type=int, default=1)
+    bld.add_argument('--max-strengths', type=int, default=1)
+    bld.add_argument('--workers', type=int, help="processes (default: all cores)")
+    bld.add_argument('--samples', type=int, default=1000, help="rows re-scored live after the build")
+    ver = sub.add_parser('verify')
+    ver.add_argument('--path', default=TABLE_DIR)
+    ver.add_argument('--samples', type=int, default=1000)
+    ver.add_argument('--model', help="the model the table was built from (default: the one recorded at build)")
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'build':
+        start = time.perf_counter()
+        space = build_table(args.model, args.out, args.max_interests, args.max_strengths, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(args.out, f)) for f in os.listdir(args.out))
+        full = AnswerSpace(space.vocab['interests'], space.vocab['strengths'], 3, 3)
+        print(f"{space.size:,} answer combinations tabulated in {elapsed:.1f}s, {size / 1e6:.1f} MB on disk")
+        print(f"(the full 3-interest x 3-strength space has {full.size:,} combinations)")
+        path = args.out
+    else:
+        path = args.path
+    try:
+        n, bad = verify(path, args.samples, model_path=args.model)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"Verified {n} random rows against live scoring: {bad} mismatches")
+    if bad:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+import argparse
+import json
+import os
+import shutil
+
+import numpy as np
+
+ARTIFACT_DIR = 'career_model'
+FORMAT_VERSION = 1
+NODE_ARRAYS = ('feature', 'threshold', 'left', 'right', 'value', 'roots')
+
+
+# --- 1. FOREST -> FLAT NODE ARRAYS ---
+def export_forest(model):
+    """Flatten a fitted RandomForestClassifier into contiguous node arrays.
+
+    All trees share one node numbering; `roots` holds the first node of each tree. Leaves
+    point to themselves and carry the class distribution that sklearn's
+    DecisionTreeClassifier.predict_proba returns for them: tree_.value as stored from
+    scikit-learn 1.4 on, normalized class counts before it.
+    """
+    from sklearn.utils.fixes import parse_version
+    import sklearn
+
+    counts = parse_version(sklearn.__version__) < parse_version('1.4')
+    trees = [est.tree_ for est in model.estimators_]
+    roots = np.cumsum([0] + [t.node_count for t in trees[:-1]])
+    n_classes = model.n_classes_
+
+    feature, threshold, left, right, value = [], [], [], [], []
+    for t, off in zip(trees, roots):
+        leaf = t.children_left == -1
+        nodes = np.arange(t.node_count)
+        feature.append(np.where(leaf, 0, t.feature))
+        threshold.append(np.where(leaf, 0.0, t.threshold))
+        left.append(np.where(leaf, nodes, t.children_left) + off)
+        right.append(np.where(leaf, nodes, t.children_right) + off)
+
+        proba = t.value[:, 0, :n_classes]
+        if counts:
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            proba = proba / normalizer
+        value.append(proba)
+
+    return {
+        'feature': np.concatenate(feature).astype(np.int32),
+        'threshold': np.concatenate(threshold).astype(np.float64),
+        'left': np.concatenate(left).astype(np.int32),
+        'right': np.concatenate(right).astype(np.int32),
+        'value': np.ascontiguousarray(np.concatenate(value), dtype=np.float64),
+        'roots': roots.astype(np.int32),
+    }, max(t.max_depth for t in trees)
+
+
+def tree_spans(arrays):
+    """Node range of every tree, as slices into the flat arrays."""
+    bounds = np.append(np.asarray(arrays['roots'], dtype=np.int64), len(arrays['feature']))
+    return [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def combine_forests(parts, n_classes):
+    """Concatenate chosen trees of several flat forests into one.
+
+    `parts` is a list of (arrays, columns, trees): the node arrays, the position of each of
+    their value columns among the `n_classes` combined classes, and the tree numbers to keep.
+    Classes a forest never saw get zero probability in its leaves.
+    """
+    out = {name: [] for name in NODE_ARRAYS}
+    offset = 0
+    for arrays, columns, trees in parts:
+        spans = tree_spans(arrays)
+        for t in trees:
+            span = spans[t]
+            shift = offset - span.start
+            out['feature'].append(arrays['feature'][span])
+            out['threshold'].append(arrays['threshold'][span])
+            out['left'].append(arrays['left'][span] + shift)
+            out['right'].append(arrays['right'][span] + shift)
+            value = np.zeros((span.stop - span.start, n_classes))
+            value[:, columns] = arrays['value'][span]
+            out['value'].append(value)
+            out['roots'].append(offset)
+            offset += span.stop - span.start
+    return {
+        'feature': np.concatenate(out['feature']).astype(np.int32),
+        'threshold': np.concatenate(out['threshold']).astype(np.float64),
+        'left': np.concatenate(out['left']).astype(np.int32),
+        'right': np.concatenate(out['right']).astype(np.int32),
+        'value': np.ascontiguousarray(np.concatenate(out['value']), dtype=np.float64),
+        'roots': np.array(out['roots'], dtype=np.int32),
+    }
+
+
+# --- 2. ARTIFACT DIRECTORY ---
+def save_artifact(bundle, path=ARTIFACT_DIR, forest=None, **extra):
+    """Write a model bundle as uncompressed .npy node arrays plus a meta.json of vocabularies.
+
+    `forest` is (arrays, max depth) when the node arrays were built directly rather than
+    exported from bundle['model'] (an incremental update); `extra` keys go into meta.json.
+    The files are written to a sibling directory that then replaces `path`: processes still
+    serving the old artifact keep their memory maps of the old (unlinked, not truncated) files.
+    """
+    arrays, depth = export_forest(bundle['model']) if forest is None else forest
+    path = os.path.normpath(path)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(tmp)
+    for name, arr in arrays.items():
+        np.save(os.path.join(tmp, f"{name}.npy"), arr)
+
+    meta = {
+        'format': FORMAT_VERSION,
+        'n_trees': len(arrays['roots']),
+        'max_depth': int(depth),
+        'classes': bundle['le'].classes_.tolist(),
+        'interests': bundle['mlb_int'].classes_.tolist(),
+        'strengths': bundle['mlb_str'].classes_.tolist(),
+        'features': list(bundle['features']),
+        **extra,
+    }
+    with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    _swap_dir(tmp, path)
+    return path
+
+
+def _swap_dir(src, dest):
+    # A directory cannot be renamed over a non-empty one: move the old one aside first
+    old = None
+    if os.path.isdir(dest) and os.listdir(dest):
+        old = f"{dest}.old-{os.getpid()}"
+        os.rename(dest, old)
+    os.replace(src, dest)
+    if old:
+        shutil.rmtree(old)
+
+
+def is_artifact(path):
+    return os.path.isfile(os.path.join(path, 'meta.json'))
+
+
+def load_artifact(path=ARTIFACT_DIR, mmap_mode='r'):
+    """Open an artifact without copying the forest.
+
+    With the default mmap_mode the node arrays are read-only memory maps, so every process
+    on the host serves them from the same page-cached file and opening is O(1) in forest size.
+    Returns the meta dict with the arrays under 'arrays' and sklearn-compatible encoders.
+    """
+    from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
+
+    with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta['format'] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact format {meta['format']} in {path}")
+    meta['arrays'] = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                      for name in NODE_ARRAYS}
+
+    le = LabelEncoder()
+    le.classes_ = np.array(meta['classes'], dtype=object)
+    mlb_int = MultiLabelBinarizer(classes=meta['interests']).fit([])
+    mlb_str = MultiLabelBinarizer(classes=meta['strengths']).fit([])
+    meta.update(le=le, mlb_int=mlb_int, mlb_str=mlb_str)
+    return meta
+
+
+# --- 3. STARTUP BENCHMARK ---
+def _cold_start(code, repeat):
+    import subprocess
+    import sys
+    best = float('inf')
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        best = min(best, float(out.stdout.strip()))
+    return best
+
+
+def bench(model_path, scales, repeat):
+    import copy
+    import joblib
+    import tempfile
+
+    bundle = joblib.load(model_path)
+    # Library imports are paid by both formats alike, so only the load call is timed
+    template = ("import time, sklearn.ensemble, sklearn.preprocessing, {mod}; t = time.perf_counter(); "
+                "b = {call}; print(time.perf_counter() - t)")
+    print(f"{'trees':>6} {'pickle MB':>10} {'joblib.load s':>14} {'artifact MB':>12} {'load_artifact s':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            # Bigger forests are simulated by repeating copies of the fitted trees
+            model = copy.copy(bundle['model'])
+            model.estimators_ = [copy.deepcopy(est) for est in bundle['model'].estimators_ * scale]
+            grown = dict(bundle, model=model)
+            pkl = os.path.join(tmp, f"model_{scale}.pkl")
+            art = os.path.join(tmp, f"model_{scale}")
+            joblib.dump(grown, pkl)
+            save_artifact(grown, art)
+
+            pkl_mb = os.path.getsize(pkl) / 1e6
+            art_mb = sum(os.path.getsize(os.path.join(art, f)) for f in os.listdir(art)) / 1e6
+            t_pkl = _cold_start(template.format(mod='joblib', call=f"joblib.load({pkl!r})"), repeat)
+            t_art = _cold_start(template.format(mod='artifact', call=f"artifact.load_artifact({art!r})"), repeat)
+            n_trees = len(model.estimators_)
+            print(f"{n_trees:>6} {pkl_mb:>10.1f} {t_pkl:>14.3f} {art_mb:>12.1f} {t_art:>16.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export or benchmark the flat-array model artifact.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    exp = sub.add_parser('export', help="convert career_model.pkl into an artifact directory")
+    exp.add_argument('--model', default='career_model.pkl')
+    exp.add_argument('--out', default=ARTIFACT_DIR)
+    bch = sub.add_parser('bench', help="compare cold-start load time of both formats")
+    bch.add_argument('--model', default='career_model.pkl')
+    bch.add_argument('--scales', type=int, nargs='+', default=[1, 4, 16])
+    bch.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'export':
+        import joblib
+        print(f"Artifact written to {save_artifact(joblib.load(args.model), args.out)}/")
+    else:
+        bench(args.model, args.scales, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
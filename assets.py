@@ -0,0 +1,134 @@
+import argparse
+import hashlib
+import os
+import re
+import urllib.request
+
+from images import STATIC_DIR, STATIC_URL
+
+STYLESHEET = 'app.css'
+FONT_DIR = 'fonts'
+FONT_CSS = 'fonts.css'
+# Variable Inter: one woff2 per subset covers every weight from 300 to 800
+FONT_CSS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@300..800&display=swap"
+FONT_SUBSETS = ('latin', 'latin-ext')  # latin-ext has the rupee sign used in salary figures
+# Used until the fonts are self-hosted, as before: a render-blocking third-party fetch
+GOOGLE_FONTS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap"
+GOOGLE_FONTS_IMPORT = f"@import url('{GOOGLE_FONTS_URL}');"
+WOFF2_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+
+
+# --- 1. BUILD: self-hosted fonts ---
+def fetch(url, timeout=30):
+    request = urllib.request.Request(url, headers={'User-Agent': WOFF2_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+def fetch_fonts(out=STATIC_DIR, css_url=FONT_CSS_URL, subsets=FONT_SUBSETS):
+    """Download the Inter woff2 files once and write static/fonts/fonts.css pointing at them."""
+    font_dir = os.path.join(out, FONT_DIR)
+    os.makedirs(font_dir, exist_ok=True)
+    css = fetch(css_url).decode()
+    rules = []
+    # Google's stylesheet is a sequence of "/* subset */ @font-face { ... url(...) ... }" blocks
+    for subset, block in re.findall(r'/\*\s*([\w-]+)\s*\*/\s*(@font-face\s*{[^}]*})', css):
+        if subset not in subsets:
+            continue
+        url = re.search(r'url\(([^)]+)\)', block).group(1)
+        name = f"inter-{subset}.woff2"
+        with open(os.path.join(font_dir, name), 'wb') as f:
+            f.write(fetch(url))
+        rules.append(f"/* {subset} */\n" + block.replace(url, name))
+    if not rules:
+        raise ValueError(f"No {', '.join(subsets)} @font-face rules found in {css_url}")
+    with open(os.path.join(font_dir, FONT_CSS), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(rules) + '\n')
+    return [os.path.join(font_dir, name) for name in sorted(os.listdir(font_dir))]
+
+
+# --- 2. SERVING: linked once, or inlined on every run ---
+def versioned_url(rel, path=STATIC_DIR, url_prefix=STATIC_URL):
+    """URL of a static file with a content hash query, or None if it does not exist."""
+    file_path = os.path.join(path, rel)
+    if not os.path.isfile(file_path):
+        return None
+    with open(file_path, 'rb') as f:
+        return f"{url_prefix}/{rel}?v={hashlib.sha1(f.read()).hexdigest()[:10]}"
+
+
+def head_html(static_serving, path=STATIC_DIR, url_prefix=STATIC_URL):
+    """Markup that styles the app.
+
+    With static serving the stylesheet and the self-hosted fonts are <link>ed by
+    content-hashed URL, so each rerun sends a few hundred bytes and the browser caches the
+    files; until `python assets.py fonts` has run, Inter is linked from Google Fonts instead.
+    Without static serving the stylesheet is inlined and Inter comes from Google Fonts, as before.
+    """
+    if static_serving:
+        fonts = versioned_url(f"{FONT_DIR}/{FONT_CSS}", path, url_prefix) or GOOGLE_FONTS_URL.replace('&', '&amp;')
+        urls = [fonts, versioned_url(STYLESHEET, path, url_prefix)]
+        return ''.join(f'<link rel="stylesheet" href="{url}">' for url in urls if url)
+    with open(os.path.join(path, STYLESHEET), encoding='utf-8') as f:
+        return f"<style>\n{GOOGLE_FONTS_IMPORT}\n{f.read()}</style>"
+
+
+def bench(script='app.py', reruns=15):
+    """Bytes and deltas per rerun of each page, stylesheet inlined vs linked (Streamlit AppTest)."""
+    import time
+    from streamlit import config
+    from streamlit.testing.v1 import AppTest
+    from streamlit.testing.v1 import local_script_runner
+
+    sent = {}
+    forward_msgs = local_script_runner.LocalScriptRunner.forward_msgs
+
+    def counting(runner):
+        msgs = forward_msgs(runner)
+        sent['bytes'] = sum(m.ByteSize() for m in msgs)
+        sent['deltas'] = sum(1 for m in msgs if m.WhichOneof('type') == 'delta')
+        return msgs
+
+    local_script_runner.LocalScriptRunner.forward_msgs = counting
+    results = {}
+    try:
+        for mode, static in (('inline', False), ('static', True)):
+            config.set_option('server.enableStaticServing', static)
+            at = AppTest.from_file(os.path.abspath(script), default_timeout=60).run()
+            results[mode, 'Questionnaire'] = dict(sent)
+            at.multiselect[0].set_value(at.multiselect[0].options[:1])
+            at.multiselect[1].set_value(at.multiselect[1].options[:1])
+            next(b for b in at.button if 'Generate' in b.label).click().run()
+            for page in ('Results', 'Roadmaps'):
+                at.session_state.page = page
+                times = []
+                for _ in range(reruns):
+                    start = time.perf_counter()
+                    at.run()
+                    times.append(time.perf_counter() - start)
+                results[mode, page] = dict(sent, ms=sorted(times)[len(times) // 2] * 1e3)
+    finally:
+        local_script_runner.LocalScriptRunner.forward_msgs = forward_msgs
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Self-host the app fonts and measure stylesheet delivery.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    fonts = sub.add_parser('fonts', help="download Inter woff2 files into static/fonts/")
+    fonts.add_argument('--out', default=STATIC_DIR)
+    sub.add_parser('bench', help="bytes per rerun with the stylesheet inlined vs linked")
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'fonts':
+        for path in fetch_fonts(args.out):
+            print(f"{os.path.getsize(path) / 1e3:8.1f} kB  {path}")
+        return
+    results = bench()
+    for (mode, page), r in results.items():
+        timing = f"  {r['ms']:6.1f} ms" if 'ms' in r else ""
+        print(f"{mode:6s} {page:13s} {r['deltas']:4d} deltas  {r['bytes'] / 1e3:6.1f} kB{timing}")
+
+
+if __name__ == '__main__':
+    main()
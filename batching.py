@@ -0,0 +1,119 @@
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class BatchMetrics:
+    """Batch-size histogram and queueing delay (submit -> batch start) of a MicroBatcher."""
+
+    def __init__(self, samples=10_000):
+        self.sizes = Counter()
+        self.delays = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def record(self, size, delays):
+        with self._lock:
+            self.sizes[size] += 1
+            self.delays.extend(delays)
+
+    def snapshot(self):
+        with self._lock:
+            batches = sum(self.sizes.values())
+            requests = sum(size * n for size, n in self.sizes.items())
+            delays = sorted(self.delays)
+
+        def pct(q):
+            return delays[min(len(delays) - 1, int(q * (len(delays) - 1)))] * 1e3 if delays else 0.0
+        return {"batches": batches, "requests": requests, "mean_batch": requests / batches if batches else 0.0,
+                "batch_sizes": dict(sorted(self.sizes.items())),
+                "queue_delay_ms": {"p50": pct(0.5), "p99": pct(0.99), "max": pct(1.0)}}
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-profile requests into batched scoring calls.
+
+    A collector thread takes the first waiting request, keeps gathering until `max_batch`
+    requests or `max_delay` seconds after that first one, then hands the batch to
+    `score_batch(profiles) -> rankings` and resolves each caller's Future with its own ranking.
+    Up to `concurrency` batches are scored at the same time. Once closed, submit raises
+    RuntimeError; requests queued before close are still scored.
+    """
+
+    def __init__(self, score_batch, max_batch=64, max_delay=0.005, concurrency=1):
+        self.score_batch = score_batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.metrics = BatchMetrics()
+        self._queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(concurrency, thread_name_prefix='microbatch')
+        self._slots = threading.Semaphore(concurrency)
+        self._closed = False
+        self._lock = threading.Lock()
+        self._collector = threading.Thread(target=self._collect, name='microbatch-collector', daemon=True)
+        self._collector.start()
+
+    def submit(self, profile):
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._queue.put((time.monotonic(), profile, future))
+        return future
+
+    def rank(self, profile, timeout=None):
+        return self.submit(profile).result(timeout)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._collector.join()
+        self._pool.shutdown()
+        # Nothing should be left behind the sentinel, but never leave a caller waiting
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[2].set_exception(RuntimeError("MicroBatcher is closed"))
+
+    def _collect(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = first[0] + self.max_delay
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+            # Wait for a free scoring slot; requests arriving meanwhile join the next batch
+            self._slots.acquire()
+            self._pool.submit(self._run, batch)
+
+    def _run(self, batch):
+        try:
+            started = time.monotonic()
+            self.metrics.record(len(batch), [started - enqueued for enqueued, _, _ in batch])
+            try:
+                rankings = self.score_batch([profile for _, profile, _ in batch])
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                return
+            for (_, _, future), ranking in zip(batch, rankings):
+                future.set_result(ranking)
+        finally:
+            self._slots.release()
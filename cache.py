@@ -0,0 +1,68 @@
+import threading
+import time
+from collections import OrderedDict
+
+from features import CAT_FIELDS, MULTI_FIELDS
+
+
+def profile_key(profile, model_version=None):
+    """Canonical, hashable form of a questionnaire answer: multi-selects are order-free."""
+    return ((model_version,)
+            + tuple(profile.get(key) for key in CAT_FIELDS)
+            + tuple(tuple(sorted(set(profile.get(key, ())))) for key in MULTI_FIELDS))
+
+
+class RankingCache:
+    """Bounded, thread-safe LRU of finished rankings keyed on the canonical answer tuple.
+
+    Entries can expire after `ttl` seconds, and keys carry the model version so a newly
+    deployed model never serves rankings computed by the previous one.
+    """
+
+    def __init__(self, maxsize=4096, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > self.clock()):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, profile, compute, model_version=None):
+        """Return the cached ranking for `profile`, calling `compute()` only on a miss."""
+        key = profile_key(profile, model_version)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data),
+                    "maxsize": self.maxsize, "hit_rate": self.hits / lookups if lookups else 0.0}
@@ -0,0 +1,31 @@
+import sys
+
+
+class CareerRegistry:
+    """Career names in model class order; a career's id is its position in `le.classes_`.
+
+    Names are interned once at load time, so rankings, caches and content tables all
+    share the same string objects and look careers up by id instead of by name.
+    """
+
+    __slots__ = ('names', 'ids')
+
+    def __init__(self, names):
+        self.names = tuple(sys.intern(str(name)) for name in names)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, career_id):
+        return self.names[career_id]
+
+    def id(self, name):
+        return self.ids[name]
+
+    def get_id(self, name, default=None):
+        return self.ids.get(name, default)
+
+    def index(self, mapping, default=None):
+        """Re-key a {career name: value} dict into a tuple indexed by career id."""
+        return tuple(mapping.get(name, default) for name in self.names)
@@ -0,0 +1,57 @@
+import json
+import os
+import re
+
+CONTENT_DIR = 'content'
+CONTENT_FORMAT = 1
+
+
+def slug(career):
+    """'QA / Test Engineer' -> 'qa-test-engineer'; names a career's content and image files."""
+    return re.sub(r'[^a-z0-9]+', '-', career.lower()).strip('-')
+
+
+def content_file(career):
+    return slug(career) + '.json'
+
+
+class ContentStore:
+    """Roadmap content (Image, Stats, Prereq, Tools, Certs, Steps), one JSON file per career.
+
+    Only index.json is read up front; a career's file is parsed on first access and kept
+    for the life of the store, so a page touches just the careers it shows.
+    """
+
+    def __init__(self, path=CONTENT_DIR):
+        with open(os.path.join(path, 'index.json'), encoding='utf-8') as f:
+            index = json.load(f)
+        if index['format'] != CONTENT_FORMAT:
+            raise ValueError(f"Unsupported content format {index['format']} in {path}")
+        self.path = path
+        self.files = index['careers']
+        self._entries = {}
+
+    def __contains__(self, career):
+        return career in self.files
+
+    def __len__(self):
+        return len(self.files)
+
+    def careers(self):
+        return list(self.files)
+
+    def get(self, career):
+        """Content dict of `career`, or None if the store has no entry for it."""
+        entry = self._entries.get(career)
+        if entry is None and career in self.files:
+            with open(os.path.join(self.path, self.files[career]), encoding='utf-8') as f:
+                # setdefault: concurrent sessions that race on a first load share one dict
+                entry = self._entries.setdefault(career, json.load(f))
+        return entry
+
+    def image(self, career):
+        entry = self.get(career)
+        return entry.get('Image') if entry else None
+
+    def loaded(self):
+        return len(self._entries)
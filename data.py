@@ -1,5 +1,11 @@
-import pandas as pd
+import argparse
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
 
 # Advanced Logic: (Core_Interests, Affinity_Interests, Primary_Strengths, Secondary_Strengths, Preferred_Field)
 logic_map = {
@@ -58,28 +64,160 @@ logic_map = {
     "No-Code / Automation Specialist": (["Tech", "Optimization"], ["Workflows", "APIs", "Logic"], ["Problem Solving"], ["Adaptability", "Logic"], "Tech")
 }
 
-data = []
-for career, (core_i, aff_i, pri_s, sec_s, field) in logic_map.items():
-    for _ in range(100):
-        # 1. Interests: Core is always present, plus random logical affinities
-        selected_ints = list(set(core_i + random.sample(aff_i, random.randint(1, 2))))
-        
-        # 2. Strengths: Primary is always present, plus logical secondaries
-        selected_strs = list(set(pri_s + random.sample(sec_s, 1)))
-        
-        # 3. Decision Logic for other features
-        row = {
-            "career": career,
-            "interests": ", ".join(selected_ints),
-            "strengths": ", ".join(selected_strs),
-            "field": field if random.random() > 0.15 else random.choice(["Science", "Commerce", "Arts", "Tech"]),
-            "education": "Master's" if career in ["Medical Doctor", "Management Consultant", "Public Health Professional"] else "Bachelor's",
-            "learning_rate": "Fast" if "Tech" in field or "Science" in field else "Steady",
-            "time_horizon": "Long (5+ yrs)" if career in ["Medical Doctor", "Architect", "Chartered Engineer"] else "Short (1-2 yrs)",
-            "risk_tolerance": "High" if career in ["Entrepreneur (Early-stage)", "Commercial Pilot", "Investment Banking Analyst"] else random.choice(["Low", "Medium"])
-        }
-        data.append(row)
-
-df = pd.DataFrame(data)
-df.to_csv('newdata.csv', index=False)
-print("Sophisticated Logic Dataset 'pd2.csv' ready!")
\ No newline at end of file
+COLUMNS = ["career", "interests", "strengths", "field", "education", "learning_rate", "time_horizon", "risk_tolerance"]
+FIELDS = ["Science", "Commerce", "Arts", "Tech"]
+MASTERS_CAREERS = ["Medical Doctor", "Management Consultant", "Public Health Professional"]
+LONG_HORIZON_CAREERS = ["Medical Doctor", "Architect", "Chartered Engineer"]
+HIGH_RISK_CAREERS = ["Entrepreneur (Early-stage)", "Commercial Pilot", "Investment Banking Analyst"]
+CHUNK_ROWS = 100_000
+
+
+def build_rows(rows_per_career=100):
+    """The original row-by-row generator behind newdata.csv."""
+    data = []
+    for career, (core_i, aff_i, pri_s, sec_s, field) in logic_map.items():
+        for _ in range(rows_per_career):
+            # 1. Interests: Core is always present, plus random logical affinities
+            selected_ints = list(set(core_i + random.sample(aff_i, random.randint(1, 2))))
+
+            # 2. Strengths: Primary is always present, plus logical secondaries
+            selected_strs = list(set(pri_s + random.sample(sec_s, 1)))
+
+            # 3. Decision Logic for other features
+            row = {
+                "career": career,
+                "interests": ", ".join(selected_ints),
+                "strengths": ", ".join(selected_strs),
+                "field": field if random.random() > 0.15 else random.choice(FIELDS),
+                "education": "Master's" if career in MASTERS_CAREERS else "Bachelor's",
+                "learning_rate": "Fast" if "Tech" in field or "Science" in field else "Steady",
+                "time_horizon": "Long (5+ yrs)" if career in LONG_HORIZON_CAREERS else "Short (1-2 yrs)",
+                "risk_tolerance": "High" if career in HIGH_RISK_CAREERS else random.choice(["Low", "Medium"])
+            }
+            data.append(row)
+    return pd.DataFrame(data)
+
+
+# --- VECTORIZED GENERATOR (load-test scale) ---
+def _joined(*parts):
+    return ", ".join(dict.fromkeys(item for part in parts for item in part))
+
+
+def sample_career(career, n, rng, spec=None):
+    """Draw `n` rows for one career with the same distribution as build_rows, in bulk.
+
+    `spec` overrides the career's logic_map entry (e.g. for a synthetic catalogue).
+    """
+    core_i, aff_i, pri_s, sec_s, field = spec or logic_map[career]
+
+    # Every possible interest set: core + 1 or 2 affinities, each size picked with p=0.5
+    singles = [_joined(core_i, [a]) for a in aff_i]
+    pairs = [_joined(core_i, pair) for pair in combinations(aff_i, 2)]
+    two = rng.random(n) < 0.5
+    interests = np.where(two, np.array(pairs, dtype=object)[rng.integers(0, len(pairs), n)],
+                         np.array(singles, dtype=object)[rng.integers(0, len(singles), n)])
+    strengths = np.array([_joined(pri_s, [s]) for s in sec_s], dtype=object)[rng.integers(0, len(sec_s), n)]
+
+    fields = np.where(rng.random(n) > 0.15, field, np.array(FIELDS, dtype=object)[rng.integers(0, len(FIELDS), n)])
+    risk = "High" if career in HIGH_RISK_CAREERS else np.array(["Low", "Medium"], dtype=object)[rng.integers(0, 2, n)]
+    return pd.DataFrame({
+        "career": career,
+        "interests": interests,
+        "strengths": strengths,
+        "field": fields,
+        "education": "Master's" if career in MASTERS_CAREERS else "Bachelor's",
+        "learning_rate": "Fast" if "Tech" in field or "Science" in field else "Steady",
+        "time_horizon": "Long (5+ yrs)" if career in LONG_HORIZON_CAREERS else "Short (1-2 yrs)",
+        "risk_tolerance": risk,
+    }, columns=COLUMNS)
+
+
+def generate_chunks(rows, seed=None, chunk_rows=CHUNK_ROWS):
+    """Yield DataFrames totalling `rows`, spread evenly over careers, at most `chunk_rows` each."""
+    rng = np.random.default_rng(seed)
+    careers = list(logic_map)
+    for start in range(0, rows, chunk_rows):
+        size = min(chunk_rows, rows - start)
+        per_career = np.full(len(careers), size // len(careers))
+        per_career[:size % len(careers)] += 1
+        yield pd.concat([sample_career(c, int(n), rng) for c, n in zip(careers, per_career) if n],
+                        ignore_index=True)
+
+
+def vocabulary():
+    """Every label and answer value the generator can emit, for the columnar format."""
+    from ingest import Vocabulary
+    return Vocabulary(logic_map, {
+        "field": set(FIELDS) | {spec[4] for spec in logic_map.values()},
+        "education": ["Bachelor's", "Master's"],
+        "learning_rate": ["Fast", "Steady"],
+        "time_horizon": ["Long (5+ yrs)", "Short (1-2 yrs)"],
+        "risk_tolerance": ["High", "Low", "Medium"],
+        "interests": {i for core_i, aff_i, *_ in logic_map.values() for i in core_i + aff_i},
+        "strengths": {s for _, _, pri_s, sec_s, _ in logic_map.values() for s in pri_s + sec_s},
+    })
+
+
+def write_shard(path, rows, seed, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """Write one shard chunk by chunk, so memory stays at one chunk regardless of `rows`."""
+    writer = None
+    if fmt == "columnar":
+        from ingest import ColumnarWriter
+        writer = ColumnarWriter(path, vocabulary(), rows)
+    try:
+        for i, chunk in enumerate(generate_chunks(rows, seed, chunk_rows)):
+            if fmt == "columnar":
+                writer.write(chunk)
+            elif fmt == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = writer or pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+            else:
+                chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def generate(out, rows, seed=None, shards=1, workers=None, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """Generate `rows` rows into `shards` files, one process per shard, independently seeded."""
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow (pip install pyarrow)")
+    stem, ext = os.path.splitext(out)
+    paths = [out] if shards == 1 else [f"{stem}-{i:05d}{ext}" for i in range(shards)]
+    sizes = [rows // shards + (i < rows % shards) for i in range(shards)]
+    seeds = np.random.SeedSequence(seed).spawn(shards)
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(write_shard, paths, sizes, seeds, [fmt] * shards, [chunk_rows] * shards))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the synthetic career dataset.")
+    parser.add_argument("--rows", type=int, help="total rows, sampled in bulk with NumPy "
+                                                 "(default: the original 100 rows per career)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--out", default="newdata.csv")
+    parser.add_argument("--format", choices=["csv", "parquet", "columnar"], default="csv",
+                        help="columnar: directory of .npy code/bit-matrix columns (see ingest.py)")
+    parser.add_argument("--shards", type=int, default=1, help="output files, written in parallel")
+    parser.add_argument("--workers", type=int, help="processes (default: all cores)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    if args.rows is None:
+        random.seed(args.seed)
+        build_rows().to_csv(args.out, index=False)
+        print(f"Sophisticated Logic Dataset '{args.out}' ready!")
+        return
+    paths = generate(args.out, args.rows, args.seed, args.shards, args.workers, args.format, args.chunk_rows)
+    print(f"{args.rows:,} rows written to {', '.join(paths)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import numpy as np
+
+# Questionnaire answers, in the same order as the one-hot columns of the training frame
+CAT_FIELDS = ['field', 'education', 'learning_rate', 'time_horizon', 'risk_tolerance']
+MULTI_FIELDS = {'interests': 'int_', 'strengths': 'str_'}
+MAX_SELECTIONS = 3
+
+# Options offered by the main_quiz form, per categorical answer
+QUESTION_CHOICES = {
+    'field': ["Tech", "Science", "Commerce", "Arts"],
+    'education': ["High School", "Bachelor's", "Master's"],
+    'learning_rate': ["Fast", "Steady"],
+    'time_horizon': ["Short (1-2 yrs)", "Medium (3-5 yrs)", "Long (5+ yrs)"],
+    'risk_tolerance': ["Low", "Medium", "High"],
+}
+
+
+class FeatureEncoder:
+    """Maps questionnaire answers straight to column indices of the model's feature list.
+
+    Built once from the `features` list stored in career_model.pkl, so encoding a request
+    is a handful of dict lookups instead of building and poking a pandas DataFrame.
+    Answers the model has never seen (e.g. "High School") switch nothing on, exactly like
+    the missing get_dummies column did.
+    """
+
+    def __init__(self, features):
+        self.features = list(features)
+        self.n_features = len(self.features)
+        self.lookup = {key: {} for key in CAT_FIELDS + list(MULTI_FIELDS)}
+        for j, col in enumerate(self.features):
+            for key, prefix in MULTI_FIELDS.items():
+                if col.startswith(prefix):
+                    self.lookup[key][col[len(prefix):]] = j
+                    break
+            else:
+                for key in CAT_FIELDS:
+                    if col.startswith(key + '_'):
+                        self.lookup[key][col[len(key) + 1:]] = j
+                        break
+
+    def indices(self, profile):
+        cols = []
+        for key in CAT_FIELDS:
+            j = self.lookup[key].get(profile.get(key))
+            if j is not None: cols.append(j)
+        for key in MULTI_FIELDS:
+            lookup = self.lookup[key]
+            for answer in profile.get(key, ()):
+                j = lookup.get(answer)
+                if j is not None: cols.append(j)
+        return cols
+
+    def encode(self, profile, out=None):
+        """Encode one profile as a (1 x n_features) float32 row, optionally into a caller-owned buffer."""
+        if out is None:
+            out = np.zeros((1, self.n_features), dtype=np.float32)
+        else:
+            out.fill(0)
+        out[0, self.indices(profile)] = 1
+        return out
+
+    def encode_batch(self, profiles, sparse=False):
+        """Encode many profiles as a dense matrix, or as a CSR matrix when `sparse` is set."""
+        indptr, indices = [0], []
+        for profile in profiles:
+            indices.extend(self.indices(profile))
+            indptr.append(len(indices))
+        n_rows = len(indptr) - 1
+        if sparse:
+            from scipy.sparse import csr_matrix
+            data = np.ones(len(indices), dtype=np.float32)
+            return csr_matrix((data, indices, indptr), shape=(n_rows, self.n_features))
+        X = np.zeros((n_rows, self.n_features), dtype=np.float32)
+        X[np.repeat(np.arange(n_rows), np.diff(indptr)), indices] = 1
+        return X
+
+
+# --- MICRO-BENCHMARK: DataFrame feature vector vs compiled encoder ---
+def _dataframe_encode(profile, features):
+    # The per-request path app.py used before the encoder existed
+    import pandas as pd
+    input_df = pd.DataFrame(0, index=[0], columns=features)
+    for col in [f"{key}_{profile[key]}" for key in CAT_FIELDS]:
+        if col in input_df.columns: input_df.at[0, col] = 1
+    for i in profile['interests']: input_df.at[0, f"int_{i}"] = 1
+    for s in profile['strengths']: input_df.at[0, f"str_{s}"] = 1
+    return input_df
+
+
+def main(argv=None):
+    import argparse
+    import timeit
+    from scoring import load_bundle, read_profiles
+
+    parser = argparse.ArgumentParser(description="Compare per-request feature encoding cost.")
+    parser.add_argument('--model')
+    parser.add_argument('--data', default='newdata.csv')
+    parser.add_argument('-n', '--requests', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    features = load_bundle(args.model)['features']
+    profiles = read_profiles(args.data)[:args.requests]
+    encoder = FeatureEncoder(features)
+    assert all((_dataframe_encode(p, features).to_numpy(np.float32) == encoder.encode(p)).all() for p in profiles[:50])
+
+    def per_request(fn):
+        return min(timeit.repeat(lambda: [fn(p) for p in profiles], number=1, repeat=3)) / len(profiles) * 1e6
+
+    df_us = per_request(lambda p: _dataframe_encode(p, features))
+    row_us = per_request(encoder.encode)
+    batch_us = min(timeit.repeat(lambda: encoder.encode_batch(profiles, sparse=True), number=1, repeat=3)) / len(profiles) * 1e6
+    print(f"DataFrame + .at[]   : {df_us:9.2f} us/request")
+    print(f"FeatureEncoder row  : {row_us:9.2f} us/request ({df_us / row_us:.0f}x faster)")
+    print(f"FeatureEncoder CSR  : {batch_us:9.2f} us/profile in a batch of {len(profiles)}")
+
+
+if __name__ == '__main__':
+    main()
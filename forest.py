@@ -0,0 +1,132 @@
+import argparse
+
+import numpy as np
+
+from artifact import export_forest
+
+
+class FlatForest:
+    """Random forest evaluated from contiguous node arrays instead of sklearn estimators.
+
+    Every tree is walked at once: one gather per depth level moves all (row, tree) cursors
+    to a child, and leaves point to themselves so finished trees just stay put. Leaf values
+    are summed tree by tree and divided by the tree count, the same float operations
+    RandomForestClassifier.predict_proba performs, so probabilities match it exactly.
+    """
+
+    def __init__(self, arrays, max_depth):
+        # Index arrays are small; widening them to intp once saves a cast on every take().
+        # The leaf values, which dominate the artifact size, stay memory-mapped.
+        self.feature = np.asarray(arrays['feature'], dtype=np.intp)
+        self.threshold = arrays['threshold']
+        self.left = np.asarray(arrays['left'], dtype=np.intp)
+        self.right = np.asarray(arrays['right'], dtype=np.intp)
+        self.value = arrays['value']
+        self.roots = np.asarray(arrays['roots'], dtype=np.intp)
+        self.max_depth = int(max_depth)
+        self.n_trees = len(self.roots)
+        self.classes_ = np.arange(self.value.shape[1])
+
+    @classmethod
+    def from_model(cls, model):
+        arrays, depth = export_forest(model)
+        return cls(arrays, depth)
+
+    @classmethod
+    def from_artifact(cls, meta):
+        return cls(meta['arrays'], meta['max_depth'])
+
+    def apply(self, X):
+        """Leaf node index reached in every tree, shape (n_samples, n_trees)."""
+        if hasattr(X, 'toarray'):
+            X = X.toarray()
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_samples, n_features = X.shape
+        X = X.ravel()
+        node = np.tile(self.roots, n_samples)
+        row_base = np.repeat(np.arange(n_samples) * n_features, self.n_trees)
+
+        # Only cursors still sitting on a split node are advanced at each level
+        active = np.arange(node.size)
+        for _ in range(self.max_depth):
+            cur = node.take(active)
+            go_left = X.take(row_base.take(active) + self.feature.take(cur)) <= self.threshold.take(cur)
+            nxt = np.where(go_left, self.left.take(cur), self.right.take(cur))
+            node[active] = nxt
+            active = active[nxt != cur]
+            if not active.size:
+                break
+        node = node.reshape(n_samples, self.n_trees)
+        return node
+
+    def predict_proba(self, X, chunk_size=256):
+        n = X.shape[0]
+        proba = np.zeros((n, len(self.classes_)), dtype=np.float64)
+        for start in range(0, n, chunk_size):
+            leaves = self.apply(X[start:start + chunk_size])
+            out = proba[start:start + chunk_size]
+            for t in range(self.n_trees):
+                out += self.value[leaves[:, t]]
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+
+# --- PARITY CHECK & BENCHMARK ---
+def training_matrix(df, bundle):
+    """Rebuild the model.ipynb feature frame for `df`, in the bundle's column order."""
+    import pandas as pd
+    from scoring import split_list
+
+    int_df = pd.DataFrame(bundle['mlb_int'].transform(df['interests'].apply(split_list)),
+                          columns=[f"int_{c}" for c in bundle['mlb_int'].classes_])
+    str_df = pd.DataFrame(bundle['mlb_str'].transform(df['strengths'].apply(split_list)),
+                          columns=[f"str_{c}" for c in bundle['mlb_str'].classes_])
+    df_cat = pd.get_dummies(df[['field', 'education', 'learning_rate', 'time_horizon', 'risk_tolerance']])
+    X = pd.concat([df_cat, int_df, str_df], axis=1)
+    return X.reindex(columns=bundle['features'], fill_value=0)
+
+
+def main(argv=None):
+    import time
+    import warnings
+    import joblib
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Check FlatForest against sklearn and time both.")
+    parser.add_argument('--model', default='career_model.pkl')
+    parser.add_argument('--data', default='newdata.csv')
+    args = parser.parse_args(argv)
+    warnings.filterwarnings('ignore', message='X does not have valid feature names')
+
+    bundle = joblib.load(args.model)
+    model = bundle['model']
+    flat = FlatForest.from_model(model)
+    X = training_matrix(pd.read_csv(args.data), bundle).to_numpy(np.float32)
+
+    expected, got = model.predict_proba(X), flat.predict_proba(X)
+    identical = np.array_equal(expected, got)
+    print(f"Parity on {len(X)} rows: {'identical' if identical else 'MISMATCH'} "
+          f"(max abs diff {np.abs(expected - got).max():.3g})")
+
+    def best(fn, repeat=5):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    row = X[:1]
+    print(f"single row: sklearn {best(lambda: model.predict_proba(row)) * 1e3:.2f} ms, "
+          f"FlatForest {best(lambda: flat.predict_proba(row)) * 1e3:.2f} ms")
+    print(f"{len(X)} rows : sklearn {best(lambda: model.predict_proba(X)) * 1e3:.1f} ms, "
+          f"FlatForest {best(lambda: flat.predict_proba(X)) * 1e3:.1f} ms")
+    if not identical:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
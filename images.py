@@ -0,0 +1,209 @@
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+import urllib.request
+from urllib.parse import urlsplit
+
+from content import CONTENT_DIR, ContentStore, slug
+
+STATIC_DIR = 'static'            # served by Streamlit at /app/static (server.enableStaticServing)
+STATIC_URL = 'app/static'
+THUMB_DIR = 'thumbs'
+SOURCE_DIR = 'image_sources'     # downloaded or hand-supplied originals, one <slug>.<ext> per image
+PLACEHOLDER = 'placeholder.svg'
+MANIFEST_FORMAT = 1
+WEBP_QUALITY = 80
+# Display height (px) of the results card and the roadmap header -> thumbnail box (w, h)
+THUMB_SIZES = {160: (320, 160), 280: (1120, 280)}
+# Sidebar and header logos: name -> (remote original, output width: 2x the displayed width)
+ICONS = {
+    'sidebar-logo': ("https://cdn-icons-png.flaticon.com/512/1087/1087840.png", 140),
+    'header-logo': ("https://cdn-icons-png.flaticon.com/512/3135/3135715.png", 180),
+}
+SOURCE_EXTS = ('.jpg', '.jpeg', '.png', '.webp')
+HASHED = re.compile(r'-[0-9a-f]{10}\.webp$')
+
+
+# --- 1. BUILD (fetch once, resize to WebP, content-hashed names) ---
+def remote_sources(store=None):
+    """{file stem: remote URL} for every career image and logo."""
+    store = ContentStore(CONTENT_DIR) if store is None else store
+    sources = {slug(career): store.image(career) for career in store.careers()}
+    sources.update({name: url for name, (url, _) in ICONS.items()})
+    return sources
+
+
+def find_source(source_dir, stem):
+    for ext in SOURCE_EXTS:
+        path = os.path.join(source_dir, stem + ext)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def fetch(url, dest, timeout=30):
+    request = urllib.request.Request(url, headers={'User-Agent': 'pathwise-images/1'})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        data = response.read()
+    with open(dest, 'wb') as f:
+        f.write(data)
+    return dest
+
+
+def encode_webp(image):
+    buf = io.BytesIO()
+    image.save(buf, 'WEBP', quality=WEBP_QUALITY, method=6)
+    return buf.getvalue()
+
+
+def thumbnail(path, size):
+    """Centre-crop and resize to exactly `size` (w, h), so object-fit never rescales it."""
+    from PIL import Image, ImageOps
+    with Image.open(path) as image:
+        return encode_webp(ImageOps.fit(image.convert('RGB'), size, Image.LANCZOS))
+
+
+def icon(path, width):
+    from PIL import Image
+    with Image.open(path) as image:
+        image = image.convert('RGBA')
+        height = max(1, round(image.height * width / image.width))
+        return encode_webp(image.resize((width, height), Image.LANCZOS))
+
+
+def write_hashed(out_dir, stem, data):
+    name = f"{stem}-{hashlib.sha1(data).hexdigest()[:10]}.webp"
+    with open(os.path.join(out_dir, name), 'wb') as f:
+        f.write(data)
+    return f"{THUMB_DIR}/{name}"
+
+
+def build_images(source_dir=SOURCE_DIR, out=STATIC_DIR, download=True, store=None):
+    """Produce every thumbnail and logo under out/thumbs plus manifest.json.
+
+    Originals missing from `source_dir` are downloaded once (unless `download` is off);
+    images that still have no source are left out of the manifest and served as the
+    placeholder. Returns (manifest, {stem: reason} for the images that were skipped).
+    """
+    store = ContentStore(CONTENT_DIR) if store is None else store
+    thumb_dir = os.path.join(out, THUMB_DIR)
+    os.makedirs(thumb_dir, exist_ok=True)
+    os.makedirs(source_dir, exist_ok=True)
+    careers = {slug(career): career for career in store.careers()}
+    manifest = {'format': MANIFEST_FORMAT, 'careers': {}, 'icons': {}}
+    skipped = {}
+    for stem, url in remote_sources(store).items():
+        path = find_source(source_dir, stem)
+        if path is None and download and url:
+            ext = os.path.splitext(urlsplit(url).path)[1].lower()
+            try:
+                path = fetch(url, os.path.join(source_dir, stem + (ext if ext in SOURCE_EXTS else '.jpg')))
+            except OSError as e:
+                skipped[stem] = f"download failed: {e}"
+                continue
+        if path is None:
+            skipped.setdefault(stem, "no source image")
+            continue
+        if stem in ICONS:
+            manifest['icons'][stem] = write_hashed(thumb_dir, stem, icon(path, ICONS[stem][1]))
+        else:
+            manifest['careers'][careers[stem]] = {
+                str(height): write_hashed(thumb_dir, f"{stem}-{height}", thumbnail(path, size))
+                for height, size in THUMB_SIZES.items()}
+
+    # Drop thumbnails from earlier builds that the new manifest no longer references
+    keep = {os.path.basename(p) for entry in manifest['careers'].values() for p in entry.values()}
+    keep |= {os.path.basename(p) for p in manifest['icons'].values()}
+    for path in glob.glob(os.path.join(thumb_dir, '*.webp')):
+        if HASHED.search(path) and os.path.basename(path) not in keep:
+            os.remove(path)
+    with open(os.path.join(thumb_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    return manifest, skipped
+
+
+def make_fixtures(dest, store=None):
+    """Write a synthetic original for every image, so the build runs offline."""
+    from PIL import Image, ImageDraw
+    os.makedirs(dest, exist_ok=True)
+    for stem in remote_sources(store):
+        seed = hashlib.sha1(stem.encode()).digest()
+        if stem in ICONS:
+            image = Image.new('RGBA', (512, 512), (0, 0, 0, 0))
+            ImageDraw.Draw(image).ellipse((32, 32, 480, 480), fill=(*seed[:3], 255))
+            image.save(os.path.join(dest, stem + '.png'))
+        else:
+            image = Image.linear_gradient('L').resize((1600, 1067)).convert('RGB')
+            tint = Image.new('RGB', image.size, tuple(seed[:3]))
+            Image.blend(image, tint, 0.6).save(os.path.join(dest, stem + '.jpg'), quality=90)
+    return dest
+
+
+# --- 2. SERVING (manifest lookup with placeholder fallback) ---
+class ImageIndex:
+    """URLs of the local thumbnails, resolved once from static/thumbs/manifest.json.
+
+    Without a manifest (no build has run) the remote originals are used as before; with
+    one, any career or logo whose thumbnail is missing falls back to the placeholder.
+    """
+
+    def __init__(self, path=STATIC_DIR, url_prefix=STATIC_URL):
+        self.placeholder = f"{url_prefix}/{PLACEHOLDER}"
+        manifest_path = os.path.join(path, THUMB_DIR, 'manifest.json')
+        self.built = os.path.isfile(manifest_path)
+        self.careers, self.icons, self.version = {}, {}, 'remote'
+        if not self.built:
+            return
+        with open(manifest_path, 'rb') as f:
+            raw = f.read()
+        manifest = json.loads(raw)
+        if manifest['format'] != MANIFEST_FORMAT:
+            raise ValueError(f"Unsupported image manifest format {manifest['format']} in {path}")
+        self.version = hashlib.sha1(raw).hexdigest()[:12]
+
+        def url(rel):
+            return f"{url_prefix}/{rel}" if os.path.isfile(os.path.join(path, rel)) else None
+        self.careers = {(career, int(height)): url(rel)
+                        for career, sizes in manifest['careers'].items() for height, rel in sizes.items()}
+        self.icons = {name: url(rel) for name, rel in manifest['icons'].items()}
+
+    def url(self, career, height, remote=None):
+        if not self.built:
+            return remote or self.placeholder
+        return self.careers.get((career, height)) or self.placeholder
+
+    def icon(self, name):
+        if not self.built:
+            return ICONS[name][0]
+        return self.icons.get(name) or self.placeholder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build local WebP thumbnails for career images and logos.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    bld = sub.add_parser('build')
+    bld.add_argument('--source-dir', default=SOURCE_DIR, help="originals named <career-slug>.jpg/.png/.webp")
+    bld.add_argument('--out', default=STATIC_DIR)
+    bld.add_argument('--offline', action='store_true', help="never download; use only --source-dir")
+    fix = sub.add_parser('fixtures', help="write synthetic originals for an offline build")
+    fix.add_argument('dest')
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'fixtures':
+        print(f"Fixture images written to {make_fixtures(args.dest)}/")
+        return
+    manifest, skipped = build_images(args.source_dir, args.out, download=not args.offline)
+    files = [p for entry in manifest['careers'].values() for p in entry.values()] + list(manifest['icons'].values())
+    size = sum(os.path.getsize(os.path.join(args.out, p)) for p in files)
+    print(f"{len(manifest['careers'])} careers and {len(manifest['icons'])} logos -> {len(files)} WebP files, "
+          f"{size / 1e3:.0f} kB in {os.path.join(args.out, THUMB_DIR)}/")
+    for stem, reason in sorted(skipped.items()):
+        print(f"  {stem}: {reason} (placeholder)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+from features import CAT_FIELDS, MULTI_FIELDS, FeatureEncoder
+
+COLUMNS = ['career', 'interests', 'strengths'] + CAT_FIELDS
+CHUNK_ROWS = 100_000
+COLUMNAR_FORMAT = 1
+
+
+class Vocabulary:
+    """Fixed label and feature vocabulary, so every chunk encodes into the same columns.
+
+    Column order matches the training frame of model.ipynb: get_dummies of CAT_FIELDS (sorted
+    values per field), then the interest and strength items in MultiLabelBinarizer order.
+    A bundle passes its own `features` (and career order) instead, since an incremental
+    update appends new values at the end rather than re-sorting.
+    """
+
+    def __init__(self, careers, values, features=None):
+        self.careers = sorted(careers) if features is None else list(careers)
+        self.values = {key: sorted(values[key]) for key in CAT_FIELDS + list(MULTI_FIELDS)}
+        if features is None:
+            features = [f"{key}_{v}" for key in CAT_FIELDS for v in self.values[key]]
+            features += [f"{prefix}{v}" for key, prefix in MULTI_FIELDS.items() for v in self.values[key]]
+        self.features = list(features)
+        self.career_index = {c: i for i, c in enumerate(self.careers)}
+        self.position = {key: {v: i for i, v in enumerate(vals)} for key, vals in self.values.items()}
+        self.encoder = FeatureEncoder(self.features)
+
+    @classmethod
+    def from_bundle(cls, bundle):
+        lookup = FeatureEncoder(bundle['features']).lookup
+        return cls(bundle['le'].classes_.tolist(), {key: list(lookup[key]) for key in lookup}, bundle['features'])
+
+    def encoders(self):
+        """LabelEncoder / MultiLabelBinarizer objects for a load_bundle-compatible dict."""
+        from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
+        le = LabelEncoder()
+        le.classes_ = np.array(self.careers, dtype=object)
+        return {'le': le,
+                'mlb_int': MultiLabelBinarizer(classes=self.values['interests']).fit([]),
+                'mlb_str': MultiLabelBinarizer(classes=self.values['strengths']).fit([]),
+                'features': self.features}
+
+
+def split_tokens(series):
+    """Explode a column of comma-joined strings into one stripped token per row label."""
+    tokens = series.fillna('').str.split(',').explode().str.strip()
+    return tokens[tokens != '']
+
+
+def iter_chunks(path, chunksize=CHUNK_ROWS):
+    return pd.read_csv(path, usecols=COLUMNS, dtype=str, chunksize=chunksize)
+
+
+def scan_vocabulary(path, chunksize=CHUNK_ROWS):
+    """One streaming pass that only collects the distinct labels and answer values."""
+    careers = set()
+    values = {key: set() for key in CAT_FIELDS + list(MULTI_FIELDS)}
+    for chunk in iter_chunks(path, chunksize):
+        careers.update(chunk['career'].dropna().unique())
+        for key in CAT_FIELDS:
+            values[key].update(chunk[key].dropna().unique())
+        for key in MULTI_FIELDS:
+            values[key].update(split_tokens(chunk[key]).unique())
+    return Vocabulary(careers, values)
+
+
+def encode_chunk(chunk, vocab):
+    """Encode one chunk straight to a CSR matrix; answers outside the vocabulary are dropped."""
+    chunk = chunk.reset_index(drop=True)
+    rows, cols = [], []
+    for key in CAT_FIELDS:
+        col = chunk[key].map(vocab.encoder.lookup[key]).dropna()
+        rows.append(col.index.to_numpy())
+        cols.append(col.to_numpy(np.int64))
+    for key in MULTI_FIELDS:
+        col = split_tokens(chunk[key]).map(vocab.encoder.lookup[key]).dropna()
+        rows.append(col.index.to_numpy())
+        cols.append(col.to_numpy(np.int64))
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    X = csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                   shape=(len(chunk), len(vocab.features)))
+    X.sum_duplicates()
+    X.data[:] = 1
+    y = chunk['career'].map(vocab.career_index)
+    return X, y.to_numpy()
+
+
+def iter_encoded(path, vocab, chunksize=CHUNK_ROWS):
+    for chunk in iter_chunks(path, chunksize):
+        X, y = encode_chunk(chunk, vocab)
+        known = ~pd.isna(y)
+        yield X[known], y[known].astype(np.int64)
+
+
+# --- COLUMNAR BINARY FORMAT ---
+# A directory of uncompressed .npy columns plus meta.json: int codes for the label and each
+# categorical answer, bit-packed (np.packbits) membership matrices for interests/strengths.
+def encode_columns(chunk, vocab):
+    chunk = chunk.reset_index(drop=True)
+    columns = {'career': chunk['career'].map(vocab.career_index).fillna(-1).to_numpy(np.int16)}
+    for key in CAT_FIELDS:
+        columns[key] = chunk[key].map(vocab.position[key]).fillna(-1).to_numpy(np.int8)
+    for key in MULTI_FIELDS:
+        tokens = split_tokens(chunk[key]).map(vocab.position[key]).dropna()
+        bits = np.zeros((len(chunk), len(vocab.values[key])), dtype=bool)
+        bits[tokens.index.to_numpy(), tokens.to_numpy(np.int64)] = True
+        columns[key] = np.packbits(bits, axis=1)
+    return columns
+
+
+class ColumnarWriter:
+    """Fill a columnar dataset of a known row count chunk by chunk."""
+
+    def __init__(self, path, vocab, rows):
+        os.makedirs(path, exist_ok=True)
+        self.path, self.vocab, self.rows, self.offset = path, vocab, rows, 0
+        shapes = {'career': ((rows,), np.int16)}
+        shapes.update({key: ((rows,), np.int8) for key in CAT_FIELDS})
+        shapes.update({key: ((rows, (len(vocab.values[key]) + 7) // 8), np.uint8) for key in MULTI_FIELDS})
+        self.arrays = {name: np.lib.format.open_memmap(os.path.join(path, f"{name}.npy"), mode='w+',
+                                                       dtype=dtype, shape=shape)
+                       for name, (shape, dtype) in shapes.items()}
+
+    def write(self, chunk):
+        for name, values in encode_columns(chunk, self.vocab).items():
+            self.arrays[name][self.offset:self.offset + len(values)] = values
+        self.offset += len(chunk)
+
+    def close(self):
+        for arr in self.arrays.values():
+            arr.flush()
+        meta = {'format': COLUMNAR_FORMAT, 'rows': self.offset, 'careers': self.vocab.careers,
+                'values': self.vocab.values}
+        with open(os.path.join(self.path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=1)
+
+
+def is_columnar(path):
+    return os.path.isfile(os.path.join(path, 'meta.json')) and os.path.isfile(os.path.join(path, 'career.npy'))
+
+
+def csv_to_columnar(src, dst, chunksize=CHUNK_ROWS):
+    vocab = scan_vocabulary(src, chunksize)
+    rows = sum(len(chunk) for chunk in pd.read_csv(src, usecols=['career'], chunksize=chunksize))
+    writer = ColumnarWriter(dst, vocab, rows)
+    for chunk in iter_chunks(src, chunksize):
+        writer.write(chunk)
+    writer.close()
+    return dst
+
+
+class ColumnarDataset:
+    """Read side of the columnar format; with mmap the columns are paged in only as used."""
+
+    def __init__(self, path, mmap_mode='r'):
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['format'] != COLUMNAR_FORMAT:
+            raise ValueError(f"Unsupported columnar format {meta['format']} in {path}")
+        self.rows = meta['rows']
+        self.vocab = Vocabulary(meta['careers'], meta['values'])
+        names = ['career'] + CAT_FIELDS + list(MULTI_FIELDS)
+        self.columns = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)[:self.rows]
+                        for name in names}
+
+    def matrix(self, start=0, stop=None):
+        """Dense float32 training matrix for rows [start, stop), columns in vocab.features order."""
+        stop = self.rows if stop is None else min(stop, self.rows)
+        n = stop - start
+        parts = []
+        for key in CAT_FIELDS:
+            codes = np.asarray(self.columns[key][start:stop])
+            onehot = np.zeros((n, len(self.vocab.values[key])), dtype=np.float32)
+            known = codes >= 0
+            onehot[np.flatnonzero(known), codes[known]] = 1
+            parts.append(onehot)
+        for key in MULTI_FIELDS:
+            bits = np.unpackbits(self.columns[key][start:stop], axis=1, count=len(self.vocab.values[key]))
+            parts.append(bits.astype(np.float32))
+        return np.hstack(parts)
+
+    def labels(self, start=0, stop=None):
+        return np.asarray(self.columns['career'][start:stop], dtype=np.int64)
+
+    def iter_encoded(self, chunksize=CHUNK_ROWS):
+        for start in range(0, self.rows, chunksize):
+            y = self.labels(start, start + chunksize)
+            known = y >= 0
+            yield csr_matrix(self.matrix(start, start + chunksize)[known]), y[known]
+
+
+# --- LOAD BENCHMARK: CSV + split_list + MultiLabelBinarizer vs columnar ---
+def main(argv=None):
+    import time
+
+    parser = argparse.ArgumentParser(description="Convert a training CSV to the columnar format or benchmark both.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    conv = sub.add_parser('convert')
+    conv.add_argument('csv')
+    conv.add_argument('out')
+    conv.add_argument('--chunksize', type=int, default=CHUNK_ROWS)
+    bench = sub.add_parser('bench')
+    bench.add_argument('csv')
+    bench.add_argument('columnar')
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'convert':
+        print(f"Columnar dataset written to {csv_to_columnar(args.csv, args.out, args.chunksize)}/")
+        return
+
+    from train import encode
+
+    def best(fn, repeat=3):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - start)
+        return min(times), result
+
+    t_csv, (X_csv, y_csv, _) = best(lambda: encode(pd.read_csv(args.csv)))
+    t_col, (X_col, y_col) = best(lambda: (lambda ds: (ds.matrix(), ds.labels()))(ColumnarDataset(args.columnar)))
+    t_open, _ = best(lambda: ColumnarDataset(args.columnar))
+    same = np.array_equal(X_csv, X_col) and np.array_equal(y_csv, y_col)
+    csv_mb = os.path.getsize(args.csv) / 1e6
+    col_mb = sum(os.path.getsize(os.path.join(args.columnar, f)) for f in os.listdir(args.columnar)) / 1e6
+    print(f"CSV      {csv_mb:8.1f} MB  read + parse + encode {t_csv:8.3f}s")
+    print(f"columnar {col_mb:8.1f} MB  open (mmap) {t_open:8.4f}s, full matrix {t_col:8.3f}s")
+    print(f"identical training matrix: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+import argparse
+import hashlib
+import json
+from dataclasses import dataclass
+
+from content import CONTENT_DIR, ContentStore
+from roadmaps import CAREER_ROADMAPS
+
+STAGES = ('Foundation', 'Skill Building', 'Entry Level', 'Growth')
+STAT_FIELDS = ('Time', 'Market', 'Salary')
+LIST_FIELDS = ('Prereq', 'Tools', 'Certs')
+STEP_FIELDS = ('title', 'desc', 'knowledge', 'tip')
+DEFAULT_RESOURCES = ("Official Documentation", "Industry Whitepapers")
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    title: str
+    desc: str
+    knowledge: str
+    tip: str
+
+
+@dataclass(frozen=True, slots=True)
+class CareerRecord:
+    """Everything shown about one career: content/ entry merged with its CAREER_ROADMAPS ladder."""
+    id: int
+    name: str
+    image: str
+    time: str
+    market: str
+    salary: str
+    prereq: tuple
+    tools: tuple
+    certs: tuple
+    resources: tuple
+    steps: tuple
+    stages: tuple   # ((stage, (milestone, ...)), ...) in STAGES order
+    payload: bytes  # GET /roadmap response body, encoded once
+
+
+def problems(entry, ladder):
+    """What is missing from a career's content entry and roadmap ladder (empty if complete)."""
+    if entry is None:
+        return ["no content/ entry"]
+    found = []
+    if not entry.get('Image'):
+        found.append("no Image")
+    found += [f"no Stats.{key}" for key in STAT_FIELDS if not entry.get('Stats', {}).get(key)]
+    found += [f"no {key}" for key in LIST_FIELDS + ('Steps',) if not entry.get(key)]
+    for i, step in enumerate(entry.get('Steps', ())):
+        found += [f"Steps[{i}] has no {key}" for key in STEP_FIELDS if not step.get(key)]
+    if ladder is None:
+        found.append("no CAREER_ROADMAPS entry")
+    else:
+        found += [f"no roadmap stage {stage!r}" for stage in STAGES if not ladder.get(stage)]
+    return found
+
+
+def make_record(career_id, name, entry, ladder):
+    stats = entry['Stats']
+    record = dict(id=career_id, name=name, image=entry['Image'],
+                  time=stats['Time'], market=stats['Market'], salary=stats['Salary'],
+                  prereq=tuple(entry['Prereq']), tools=tuple(entry['Tools']), certs=tuple(entry['Certs']),
+                  resources=tuple(entry.get('Resources', DEFAULT_RESOURCES)),
+                  steps=tuple(Step(**{key: step[key] for key in STEP_FIELDS}) for step in entry['Steps']),
+                  stages=tuple((stage, tuple(ladder[stage])) for stage in STAGES))
+    payload = {"id": career_id, "career": name, "image": record['image'],
+               "stats": {key: stats[key] for key in STAT_FIELDS},
+               "prereq": entry['Prereq'], "tools": entry['Tools'], "certs": entry['Certs'],
+               "resources": list(record['resources']),
+               "steps": [{key: step[key] for key in STEP_FIELDS} for step in entry['Steps']],
+               "roadmap": {stage: list(milestones) for stage, milestones in record['stages']}}
+    return CareerRecord(payload=json.dumps(payload, ensure_ascii=False).encode(), **record)
+
+
+class KnowledgeBase:
+    """Immutable CareerRecords for every career the model can rank, indexed by career id.
+
+    Built once: every content file is read and merged with CAREER_ROADMAPS up front, and a
+    ValueError lists every career whose content is incomplete, so pages never need a fallback.
+    """
+
+    __slots__ = ('careers', 'records', 'version')
+
+    def __init__(self, careers, store=None, roadmaps=CAREER_ROADMAPS):
+        store = ContentStore(CONTENT_DIR) if store is None else store
+        missing = {}
+        for name in careers.names:
+            found = problems(store.get(name), roadmaps.get(name))
+            if found:
+                missing[name] = found
+        if missing:
+            detail = '; '.join(f"{name}: {', '.join(found)}" for name, found in missing.items())
+            raise ValueError(f"Incomplete content for {len(missing)} of {len(careers)} careers: {detail}")
+        self.careers = careers
+        self.records = tuple(make_record(i, name, store.get(name), roadmaps[name])
+                             for i, name in enumerate(careers.names))
+        # Content version: changes whenever any career's merged record does
+        self.version = hashlib.sha1(b'\n'.join(r.payload for r in self.records)).hexdigest()[:12]
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, career_id):
+        return self.records[career_id]
+
+    def get(self, name):
+        career_id = self.careers.get_id(name)
+        return None if career_id is None else self.records[career_id]
+
+
+def main(argv=None):
+    from scoring import load_bundle
+
+    parser = argparse.ArgumentParser(description="Check that every career the model ranks has complete content.")
+    parser.add_argument('--model', help="career_model.pkl or an artifact directory (default: auto)")
+    parser.add_argument('--content', default=CONTENT_DIR)
+    args = parser.parse_args(argv)
+
+    bundle = load_bundle(args.model)
+    store = ContentStore(args.content)
+    try:
+        kb = KnowledgeBase(bundle['careers'], store)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    unused = sorted(set(store.careers()) - set(bundle['careers'].names))
+    print(f"{len(kb)} careers complete ({sum(len(r.payload) for r in kb.records) / 1e3:.1f} kB of roadmap payloads)")
+    if unused:
+        print(f"content/ entries for careers the model does not rank: {', '.join(unused)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from features import CAT_FIELDS, MAX_SELECTIONS, QUESTION_CHOICES
+from scoring import read_profiles
+
+
+async def _request(reader, writer, host, path, payload):
+    body = json.dumps(payload).encode()
+    writer.write((f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                  f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in (b'\r\n', b''):
+            break
+        name, _, value = header.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host, port, path, make_payload, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status = await _request(reader, writer, host, path, make_payload())
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def random_profile_factory(profiles):
+    """Fresh random answers over the replayed vocabulary, so requests mostly miss the ranking cache."""
+    interests = sorted({i for p in profiles for i in p['interests']})
+    strengths = sorted({s for p in profiles for s in p['strengths']})
+
+    def make():
+        profile = {key: random.choice(QUESTION_CHOICES[key]) for key in CAT_FIELDS}
+        profile['interests'] = random.sample(interests, random.randint(1, MAX_SELECTIONS))
+        profile['strengths'] = random.sample(strengths, random.randint(1, MAX_SELECTIONS))
+        return profile
+    return make
+
+
+async def run(host, port, concurrency, duration, batch, profiles, randomize=False):
+    pick = random_profile_factory(profiles) if randomize else lambda: random.choice(profiles)
+    if batch > 1:
+        path, make_payload = '/rank:batch', lambda: {"profiles": [pick() for _ in range(batch)]}
+    else:
+        path, make_payload = '/rank', lambda: {"profile": pick()}
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, path, make_payload, deadline, latencies, errors)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the ranking API (server.py).")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('-c', '--concurrency', type=int, default=32, help="keep-alive connections")
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help="seconds")
+    parser.add_argument('--batch', type=int, default=1, help="profiles per request (>1 uses /rank:batch)")
+    parser.add_argument('--profiles', default='newdata.csv', help="CSV of profiles to replay")
+    parser.add_argument('--random', action='store_true', help="send random answers instead of replaying the CSV")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    profiles = read_profiles(args.profiles)
+    latencies, errors, elapsed = asyncio.run(
+        run(args.host, args.port, args.concurrency, args.duration, args.batch, profiles, args.random))
+    if not latencies:
+        raise SystemExit("no requests completed")
+    print(f"{len(latencies)} requests in {elapsed:.1f}s with {args.concurrency} connections "
+          f"({len(errors)} non-200)")
+    print(f"throughput  {len(latencies) / elapsed:10.1f} req/s  ({len(latencies) * args.batch / elapsed:.1f} profiles/s)")
+    print(f"latency p50 {percentile(latencies, 50) * 1e3:10.2f} ms")
+    print(f"latency p99 {percentile(latencies, 99) * 1e3:10.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+from retrieval import get_index
+from scoring import default_model_path, load_bundle
+from server import RankingServer, local_executor
+
+log = logging.getLogger('pathwise.prefork')
+SHARING = ('freeze', 'fork', 'none')
+STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+EARLY_EXIT = 10.0     # a worker that dies sooner than this after starting counts as a failed start
+MAX_FAILURES = 5      # consecutive failed starts before the master gives up
+BACKOFF = (0.5, 30.0)  # first and longest wait before replacing a worker after a failed start
+
+
+# --- 1. MEMORY ACCOUNTING ---
+def memory_usage(pid):
+    """Rss, Pss and Uss of a process in bytes (/proc/<pid>/smaps_rollup).
+
+    Uss (private clean + dirty pages) is what the process alone holds and would free on exit;
+    Pss splits every shared page evenly between the processes mapping it.
+    """
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(':')
+            if rest.strip().endswith('kB'):
+                fields[name] = int(rest.split()[0]) * 1024
+    return {'rss': fields['Rss'], 'pss': fields['Pss'], 'uss': fields['Private_Clean'] + fields['Private_Dirty']}
+
+
+def child_pids(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; the fields after its closing parenthesis do not
+        if int(stat.rpartition(')')[2].split()[1]) == pid:
+            children.append(int(entry))
+    return sorted(children)
+
+
+# --- 2. PRE-FORKED WORKERS ---
+def run_worker(sock, model_path, options):
+    """One worker: a RankingServer on the shared listening socket, scoring in this process."""
+    server = RankingServer(model_path, workers=1, executor=local_executor(model_path), **options)
+    try:
+        asyncio.run(server.serve(sock=sock))
+    finally:
+        if server.batcher is not None:
+            server.batcher.close()
+        server.executor.shutdown(cancel_futures=True)
+
+
+def worker_argv(fd, model_path, options):
+    argv = [sys.executable, os.path.abspath(__file__), 'worker', '--fd', str(fd), '--model', model_path,
+            '--max-batch', str(options.get('max_batch', 64)), '--candidates', str(options.get('candidates', 0))]
+    return argv + ['--batch-delay-ms', str(options.get('batch_delay', 0.002) * 1000)]
+
+
+def serve(model_path=None, workers=None, host='127.0.0.1', port=8000, sharing='freeze', **options):
+    """Listen once, load the model once and fork `workers` processes that serve it.
+
+    With sharing='freeze' the parent loads the bundle with the collector off and gc.freeze()s
+    everything before forking, so collections in the workers never write to (and so never
+    copy) the pages holding the parent's objects; the workers turn the collector back on.
+    'fork' shares the same way without freezing. 'none' execs a fresh interpreter per worker
+    that loads the model itself, like separate processes behind a balancer, for comparison.
+    Workers that die are replaced, after an exponential backoff while they keep dying within
+    EARLY_EXIT seconds of starting; after MAX_FAILURES such starts in a row (a bad model, port
+    or content) every worker is stopped and 1 is returned. SIGINT/SIGTERM stop them all (0).
+    `options` go to RankingServer.
+    """
+    model_path = model_path or default_model_path()
+    workers = workers or os.cpu_count()
+    sock = socket.create_server((host, port), backlog=1024)
+    sock.set_inheritable(True)
+    if sharing != 'none':
+        if sharing == 'freeze':
+            gc.disable()
+        bundle = load_bundle(model_path)
+        if options.get('candidates'):
+            get_index(bundle)
+        if sharing == 'freeze':
+            gc.freeze()
+
+    children = {}  # pid -> start time
+    stopping = []
+    failures = 0
+
+    def spawn():
+        # Stop signals stay blocked until the child has dropped the parent's handler
+        signal.pthread_sigmask(signal.SIG_BLOCK, STOP_SIGNALS)
+        pid = os.fork()
+        if pid:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, STOP_SIGNALS)
+            children[pid] = time.monotonic()
+            return
+        code = 1
+        try:
+            for sig in STOP_SIGNALS:
+                signal.signal(sig, signal.SIG_DFL)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, STOP_SIGNALS)
+            if sharing == 'none':
+                os.execv(sys.executable, worker_argv(sock.fileno(), model_path, options))
+            if sharing == 'freeze':
+                gc.enable()
+            run_worker(sock, model_path, options)
+            code = 0
+        except BaseException:
+            log.exception("worker %d failed", os.getpid())
+        finally:
+            os._exit(code)
+
+    def stop(signum, frame):
+        stopping.append(signum)
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for sig in STOP_SIGNALS:
+        signal.signal(sig, stop)
+    for _ in range(workers):
+        spawn()
+    log.info("%d workers (%s sharing) on %s: %s", workers, sharing, sock.getsockname(),
+             ' '.join(map(str, sorted(children))))
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if stopping:
+            continue
+        code = os.waitstatus_to_exitcode(status)
+        failures = failures + 1 if started is not None and time.monotonic() - started < EARLY_EXIT else 0
+        if failures >= MAX_FAILURES:
+            log.error("worker %d exited with status %d; %d failed starts in a row, stopping", pid, code, failures)
+            stop(None, None)
+            continue
+        delay = min(BACKOFF[0] * 2 ** (failures - 1), BACKOFF[1]) if failures else 0
+        log.warning("worker %d exited with status %d, starting another in %.1fs", pid, code, delay)
+        deadline = time.monotonic() + delay
+        while not stopping and time.monotonic() < deadline:
+            time.sleep(min(0.1, delay))
+        if not stopping:
+            spawn()
+    sock.close()
+    return 1 if failures >= MAX_FAILURES else 0
+
+
+# --- 3. MEMORY BENCHMARK ---
+def _wait_ready(port, workers, pid, timeout=120):
+    import http.client
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            conn.request('GET', '/healthz')
+            if conn.getresponse().status == 200 and len(child_pids(pid)) == workers:
+                # Let the other workers finish starting too (exec'd ones import and load first)
+                time.sleep(3)
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not come up")
+
+
+def bench(model_path, workers, seconds, port, profiles_path='newdata.csv'):
+    """Per-worker memory in each sharing mode, idle and after serving random profiles for `seconds`."""
+    import random
+    import subprocess
+    from loadtest import run
+    from scoring import read_profiles
+
+    profiles = read_profiles(profiles_path)
+    results = {}
+    for sharing in reversed(SHARING):
+        proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), 'serve', '--workers', str(workers),
+                                 '--port', str(port), '--sharing', sharing, '--model', model_path],
+                                stderr=subprocess.DEVNULL)
+        try:
+            _wait_ready(port, workers, proc.pid)
+            pids = child_pids(proc.pid)
+            idle = [memory_usage(pid) for pid in pids]
+            random.seed(0)
+            latencies, errors, _ = asyncio.run(run('127.0.0.1', port, 4 * workers, seconds, 1, profiles, True))
+            loaded = [memory_usage(pid) for pid in pids]
+            parent = memory_usage(proc.pid)
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            proc.wait()
+        results[sharing] = {'idle': idle, 'loaded': loaded, 'parent': parent, 'requests': len(latencies),
+                            'errors': len(errors)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the ranking API from pre-forked workers sharing one model.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    srv = sub.add_parser('serve')
+    srv.add_argument('--host', default='127.0.0.1')
+    srv.add_argument('--port', type=int, default=8000)
+    srv.add_argument('--workers', type=int, help="worker processes (default: all cores)")
+    srv.add_argument('--sharing', choices=SHARING, default='freeze',
+                     help="freeze: fork + gc.freeze (default); fork: no freeze; none: each worker loads its own")
+    wrk = sub.add_parser('worker', help=argparse.SUPPRESS)
+    wrk.add_argument('--fd', type=int, required=True)
+    bch = sub.add_parser('bench', help="per-worker memory with and without sharing")
+    bch.add_argument('--workers', type=int, default=4)
+    bch.add_argument('--seconds', type=float, default=5.0, help="load per mode before the second reading")
+    bch.add_argument('--port', type=int, default=8124)
+    for p in (srv, wrk, bch):
+        p.add_argument('--model', help="career_model.pkl or an artifact directory (default: auto)")
+    for p in (srv, wrk):
+        p.add_argument('--max-batch', type=int, default=64)
+        p.add_argument('--batch-delay-ms', type=float, default=2.0)
+        p.add_argument('--candidates', type=int, default=0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    if args.cmd == 'bench':
+        results = bench(args.model or default_model_path(), args.workers, args.seconds, args.port)
+        mb = 1 / 2 ** 20
+        print(f"{args.workers} workers, {args.model or default_model_path()}; MiB per worker (mean), "
+              f"idle -> after {args.seconds:.0f}s of random profiles")
+        print(f"{'sharing':8s} {'USS idle':>9s} {'USS load':>9s} {'RSS load':>9s} {'PSS load':>9s} "
+              f"{'total PSS':>10s} {'requests':>9s}")
+        for sharing, r in results.items():
+            def mean(key, phase):
+                return sum(m[key] for m in r[phase]) / len(r[phase]) * mb
+            total = (sum(m['pss'] for m in r['loaded']) + r['parent']['pss']) * mb
+            print(f"{sharing:8s} {mean('uss', 'idle'):9.1f} {mean('uss', 'loaded'):9.1f} {mean('rss', 'loaded'):9.1f} "
+                  f"{mean('pss', 'loaded'):9.1f} {total:10.1f} {r['requests']:9d}")
+        return
+    options = {'max_batch': args.max_batch, 'batch_delay': args.batch_delay_ms / 1000, 'candidates': args.candidates}
+    if args.cmd == 'worker':
+        model_path = args.model or default_model_path()
+        run_worker(socket.socket(fileno=args.fd), model_path, options)
+    else:
+        raise SystemExit(serve(args.model, args.workers, args.host, args.port, args.sharing, **options))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+from artifact import is_artifact, save_artifact
+from features import CAT_FIELDS, MULTI_FIELDS
+
+log = logging.getLogger('pathwise.registry')
+REGISTRY_DIR = 'models'
+MANIFEST = 'manifest.json'
+REGISTRY_FORMAT = 1
+POLL_SECONDS = 2.0
+WARMUP_PROFILES = 32
+
+
+# --- 1. REGISTRY (versioned artifact directories + manifest) ---
+def checksum(path, block=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(block), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dir_checksums(path):
+    return {name: checksum(os.path.join(path, name)) for name in sorted(os.listdir(path))}
+
+
+class ModelRegistry:
+    """models/<version>/ artifact directories plus a manifest.json naming the active one.
+
+    The manifest keeps every version's file checksums and the activation history for
+    rollback. It is rewritten with os.replace, so a reader sees the old or the new one whole.
+    """
+
+    def __init__(self, path=REGISTRY_DIR):
+        self.path = path
+        self.manifest_path = os.path.join(path, MANIFEST)
+
+    def exists(self):
+        return os.path.isfile(self.manifest_path)
+
+    def read(self):
+        if not self.exists():
+            return {'format': REGISTRY_FORMAT, 'current': None, 'history': [], 'versions': {}}
+        with open(self.manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest['format'] != REGISTRY_FORMAT:
+            raise ValueError(f"Unsupported registry format {manifest['format']} in {self.path}")
+        return manifest
+
+    def write(self, manifest):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = f"{self.manifest_path}.tmp-{os.getpid()}"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.manifest_path)
+
+    def version_path(self, version):
+        return os.path.join(self.path, version)
+
+    def current(self):
+        """(version, directory) of the active model, or (None, None) before the first publish."""
+        version = self.read()['current']
+        return (version, self.version_path(version)) if version else (None, None)
+
+    def publish(self, source, version=None, activate=True, note=''):
+        """Copy an artifact directory (or export a pickle) into the registry as a new version."""
+        manifest = self.read()
+        version = version or f"v{len(manifest['versions']) + 1}"
+        if version in manifest['versions'] or os.path.exists(self.version_path(version)):
+            raise ValueError(f"Version {version} already exists in {self.path}")
+        dest = self.version_path(version)
+        tmp = f"{dest}.tmp-{os.getpid()}"
+        if is_artifact(source):
+            shutil.copytree(source, tmp)
+        else:
+            import joblib
+            save_artifact(joblib.load(source), tmp)
+        os.rename(tmp, dest)
+        manifest['versions'][version] = {'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                                         'source': os.path.abspath(source), 'note': note,
+                                         'checksums': dir_checksums(dest)}
+        if activate:
+            self._activate(manifest, version)
+        self.write(manifest)
+        return version
+
+    def verify(self, version):
+        """Files of `version` that are missing, extra or differ from the manifest (empty if intact)."""
+        expected = self.read()['versions'][version]['checksums']
+        actual = dir_checksums(self.version_path(version))
+        return sorted(name for name in expected.keys() | actual.keys() if expected.get(name) != actual.get(name))
+
+    def _activate(self, manifest, version):
+        if manifest['current'] and manifest['current'] != version:
+            manifest['history'].append(manifest['current'])
+        manifest['current'] = version
+
+    def activate(self, version):
+        manifest = self.read()
+        if version not in manifest['versions']:
+            raise KeyError(f"No version {version} in {self.path}")
+        bad = self.verify(version)
+        if bad:
+            raise ValueError(f"Checksum mismatch in {version}: {', '.join(bad)}")
+        self._activate(manifest, version)
+        self.write(manifest)
+        return version
+
+    def rollback(self):
+        """Re-activate the version that was active before the current one."""
+        manifest = self.read()
+        if not manifest['history']:
+            raise ValueError("No earlier version to roll back to")
+        version = manifest['history'].pop()
+        bad = self.verify(version)
+        if bad:
+            raise ValueError(f"Checksum mismatch in {version}: {', '.join(bad)}")
+        manifest['current'] = version
+        self.write(manifest)
+        return version
+
+
+# --- 2. HOT RELOAD (load and warm up off the request path, then swap) ---
+def warmup_profiles(bundle, n=WARMUP_PROFILES):
+    """Deterministic profiles that between them use every answer value of the bundle."""
+    lookup = bundle['encoder'].lookup
+    values = {key: sorted(lookup[key]) for key in lookup}
+    profiles = []
+    for i in range(n):
+        profile = {key: values[key][i % len(values[key])] for key in CAT_FIELDS if values[key]}
+        for key in MULTI_FIELDS:
+            profile[key] = [values[key][(3 * i + j) % len(values[key])] for j in range(min(3, len(values[key])))]
+        profiles.append(profile)
+    return profiles
+
+
+def load_version(path, validate=None):
+    """Load a bundle outside load_bundle's cache, check it and score warm-up profiles through it.
+
+    Warm-up pages in the memory-mapped forest and builds the encoder, so the first request
+    after the swap costs what any other does.
+    """
+    from scoring import read_bundle, score_profiles
+    bundle = read_bundle(path)
+    if validate:
+        validate(bundle)
+    profiles = warmup_profiles(bundle)
+    rankings = score_profiles(profiles, bundle) + score_profiles(profiles[:1], bundle)
+    if len(rankings) != len(profiles) + 1 or not all(rankings):
+        raise ValueError("Warm-up scoring returned no rankings")
+    return bundle
+
+
+class ModelWatcher:
+    """The registry's active bundle, replaced by newly activated versions without a restart.
+
+    A daemon thread polls the manifest every `interval` seconds. On a new active version it
+    verifies the checksums, loads, validates and warms up the bundle on that thread, and only
+    then rebinds `self.bundle`; callers read the attribute once per request and so see one
+    version whole. A version that fails any step is logged in `error` and the current one stays.
+    Until a version is activated (or models/ is created) `bundle` is None and the watcher keeps
+    polling, so callers serve their default model meanwhile.
+    """
+
+    def __init__(self, registry=None, interval=POLL_SECONDS, validate=None):
+        self.registry = registry or ModelRegistry()
+        self.interval = interval
+        self.validate = validate
+        self.bundle = self.version = self.error = None
+        self.swaps = 0
+        self._stamp = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.check()
+        if self.bundle is None and self.error:
+            raise ValueError(f"Could not load the active model: {self.error}")
+
+    def check(self):
+        """Swap in the active version if it changed since the last check; True if it did."""
+        try:
+            stamp = os.stat(self.registry.manifest_path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        version, path = self.registry.current()
+        if version is None or version == self.version:
+            return False
+        start = time.perf_counter()
+        try:
+            bad = self.registry.verify(version)
+            if bad:
+                raise ValueError(f"checksum mismatch: {', '.join(bad)}")
+            bundle = load_version(path, self.validate)
+        except Exception as e:
+            self.error = f"{version}: {e}"
+            log.error("keeping %s, not swapping to %s", self.version, self.error)
+            return False
+        self.bundle, self.version, self.error = bundle, version, None
+        self.swaps += 1
+        log.info("serving %s (loaded and warmed up in %.2fs)", version, time.perf_counter() - start)
+        return True
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='model-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+# --- 3. SWAP BENCHMARK ---
+def bench(source, seconds=6.0, interval=0.05):
+    """Score single profiles back to back while a second version is activated mid-run.
+
+    Returns per-phase latency stats plus what a fresh load costs the first request without
+    the watcher (libraries already imported, as in a running app).
+    """
+    import tempfile
+    import numpy as np
+    from scoring import read_bundle, score_profiles
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = ModelRegistry(tmp)
+        registry.publish(source, 'v1')
+        registry.publish(source, 'v2', activate=False)
+        watcher = ModelWatcher(registry, interval).start()
+        profiles = warmup_profiles(watcher.bundle, 256)
+        start = time.perf_counter()
+        score_profiles(profiles[:1], read_bundle(registry.version_path('v2')))
+        cold = time.perf_counter() - start
+        latencies, activated = {'before': [], 'swapping': [], 'after': []}, None
+        start = time.perf_counter()
+        i = 0
+        while time.perf_counter() - start < seconds:
+            if activated is None and time.perf_counter() - start > seconds / 3:
+                registry.activate('v2')
+                activated = time.perf_counter()
+            t = time.perf_counter()
+            bundle = watcher.bundle
+            score_profiles([profiles[i % len(profiles)]], bundle)
+            phase = 'before' if activated is None else 'swapping' if watcher.version == 'v1' else 'after'
+            latencies[phase].append(time.perf_counter() - t)
+            i += 1
+        swapped = watcher.version == 'v2'
+        watcher.stop()
+    stats = {phase: {'n': len(v), 'p50': np.percentile(v, 50) * 1e3, 'p99': np.percentile(v, 99) * 1e3,
+                     'max': max(v) * 1e3} for phase, v in latencies.items() if v}
+    return stats, cold, swapped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Versioned model registry with hot reload.")
+    parser.add_argument('--registry', default=REGISTRY_DIR)
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    pub = sub.add_parser('publish', help="add an artifact directory or pickle as a new version")
+    pub.add_argument('source', help="e.g. career_model/ (train.py output) or career_model.pkl")
+    pub.add_argument('--version', help="version name (default: v<n>)")
+    pub.add_argument('--note', default='')
+    pub.add_argument('--no-activate', action='store_true', help="register without serving it yet")
+    act = sub.add_parser('activate', help="serve an existing version")
+    act.add_argument('version')
+    sub.add_parser('rollback', help="serve the previously active version again")
+    sub.add_parser('list')
+    ver = sub.add_parser('verify', help="check the files of every version against the manifest")
+    ver.add_argument('version', nargs='?')
+    bch = sub.add_parser('bench', help="latency while a new version is swapped in vs a cold load")
+    bch.add_argument('--source', default='career_model')
+    bch.add_argument('--seconds', type=float, default=6.0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    registry = ModelRegistry(args.registry)
+    try:
+        if args.cmd == 'publish':
+            version = registry.publish(args.source, args.version, not args.no_activate, args.note)
+            state = '' if args.no_activate else ' (active)'
+            print(f"Published {version}{state} -> {registry.version_path(version)}/")
+        elif args.cmd == 'activate':
+            print(f"Active: {registry.activate(args.version)}")
+        elif args.cmd == 'rollback':
+            print(f"Rolled back to {registry.rollback()}")
+        elif args.cmd == 'list':
+            manifest = registry.read()
+            for version, entry in manifest['versions'].items():
+                mark = '*' if version == manifest['current'] else ' '
+                print(f"{mark} {version:8s} {entry['created']}  {entry['source']}  {entry['note']}")
+        elif args.cmd == 'verify':
+            versions = [args.version] if args.version else list(registry.read()['versions'])
+            failed = {version: registry.verify(version) for version in versions}
+            for version, bad in failed.items():
+                print(f"{version:8s} {'ok' if not bad else 'MISMATCH ' + ', '.join(bad)}")
+            if any(failed.values()):
+                raise SystemExit(1)
+        else:
+            stats, cold, swapped = bench(args.source, args.seconds)
+            print(f"load + first request without the watcher: {cold * 1e3:.1f} ms")
+            for phase, s in stats.items():
+                print(f"{phase:9s} {s['n']:6d} requests  p50 {s['p50']:6.2f} ms  p99 {s['p99']:6.2f} ms  "
+                      f"max {s['max']:6.2f} ms")
+            print("swapped to v2" if swapped else "DID NOT SWAP")
+    except (KeyError, ValueError) as e:
+        raise SystemExit(str(e))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+from html import escape
+
+DEFAULT_LOCALE = 'en'
+LABELS = {
+    'en': {
+        'banner': "Personalized roadmap for <b>{career}</b>",
+        'objective': ("<b>Primary Objective:</b> Transition from a learner to a <b>{career}</b> "
+                      "within <b>{time}</b>."),
+        'prep_time': "Prep Time", 'demand': "Industry Demand", 'salary': "Salary (Entry)",
+        'difficulty': "Difficulty", 'difficulty_value': "Medium–High",
+        'prereq': "📋 Core Prerequisites", 'tools': "🛠️ Professional Toolstack",
+        'path': "🛤️ The 5-Tier Mastery Path", 'deep_dive': "Deep Dive", 'pill': "Knowledge Pill",
+        'strategy': "💡 Strategy", 'ladder': "🧭 Career Ladder",
+        'credentials': "🎓 Credentials & Learning Resources", 'certs': "Must-Have Certifications",
+        'resources': "Recommended Resources",
+        'peers': "👥 People like you chose", 'peers_note': "of the {k} most similar past profiles",
+    },
+}
+
+
+def image_card(src, height, style=""):
+    return (f'<div class="career-image-card"{style}><img src="{escape(src)}" '
+            f'style="width:100%; height:{height}px; object-fit:cover;"></div>')
+
+
+def result_card(record, image, locale=DEFAULT_LOCALE):
+    """Result row for one career with a '{score}' placeholder: image, name, score and bar."""
+    return ('<div class="result-row">' + image_card(image, 160)
+            + '<div class="result-card"><div style="display:flex; justify-content:space-between; '
+            f'align-items:center;"><h3>{escape(record.name)}</h3><h2 style="color:#007bff;">{{score}}%</h2>'
+            '</div><div class="score-bar"><span style="width:{score}%"></span></div></div></div>')
+
+
+def peer_shares(shares, k, locale=DEFAULT_LOCALE):
+    """Careers chosen by the most similar past profiles (similarity.career_shares), with bars."""
+    t = LABELS[locale]
+    rows = ''.join(f'<p><b>{escape(s["career"])}</b> · {s["share"]}%</p>'
+                   f'<div class="score-bar"><span style="width:{s["share"]}%"></span></div>' for s in shares)
+    return f'<div class="result-card"><h4>{t["peers"]}</h4>{rows}<small>{t["peers_note"].format(k=k)}</small></div>'
+
+
+def roadmap(record, image, locale=DEFAULT_LOCALE):
+    """The whole static Roadmaps tab of one career as a single HTML fragment."""
+    t = LABELS[locale]
+
+    def items(values, fmt="{}"):
+        return ''.join(f"<li>{fmt.format(escape(v))}</li>" for v in values)
+
+    def section(title, *columns):
+        head = f"<h4>{title}</h4>" if title else ""
+        return head + f'<div class="roadmap-cols">{"".join(f"<div>{c}</div>" for c in columns)}</div>'
+
+    metrics = ((t['prep_time'], record.time), (t['demand'], record.market), (t['salary'], record.salary),
+               (t['difficulty'], t['difficulty_value']))
+    steps = ''.join(
+        f'<details{" open" if i == 0 else ""}><summary>📍 {escape(step.title)}</summary>'
+        f"<p><b>{t['deep_dive']}:</b> {escape(step.desc)}</p><p><b>{t['pill']}:</b> {escape(step.knowledge)}</p>"
+        f'<p class="roadmap-tip"><b>{t["strategy"]}:</b> {escape(step.tip)}</p></details>'
+        for i, step in enumerate(record.steps))
+    return ''.join([
+        '<div class="roadmap">',
+        image_card(image, 280, ' style="margin-bottom:24px;"'),
+        f'<div class="roadmap-banner">{t["banner"].format(career=escape(record.name))}</div>',
+        f"<p>{t['objective'].format(career=escape(record.name), time=escape(record.time))}</p>",
+        '<div class="metric-grid">',
+        ''.join(f'<div><small>{label}</small><strong>{escape(value)}</strong></div>' for label, value in metrics),
+        '</div><hr>',
+        section('', f"<h4>{t['prereq']}</h4><ul>{items(record.prereq)}</ul>",
+                f"<h4>{t['tools']}</h4><p>{' / '.join(f'<code>{escape(v)}</code>' for v in record.tools)}</p>"),
+        f"<hr><h4>{t['path']}</h4>{steps}<hr>",
+        section(t['ladder'], *(f"<b>{escape(stage)}</b><ul>{items(milestones)}</ul>"
+                               for stage, milestones in record.stages)),
+        '<hr>',
+        section(t['credentials'], f"<b>{t['certs']}</b><ul>{items(record.certs, '<code>{}</code>')}</ul>",
+                f"<b>{t['resources']}</b><ul>{items(record.resources, '📚 {}')}</ul>"),
+        '</div>',
+    ])
+
+
+class RenderCache:
+    """HTML fragments per (kind, career id, locale, content version), built once and shared.
+
+    Fragments depend only on the immutable CareerRecords and the image URLs, so one
+    instance serves every session; a new knowledge base or thumbnail build (new version)
+    simply misses and renders afresh. Without an ImageIndex the remote images are used.
+    """
+
+    def __init__(self, knowledge, images=None):
+        self.knowledge = knowledge
+        self.images = images
+        self._fragments = {}
+
+    def _get(self, kind, render, career_id, height, locale):
+        key = (kind, career_id, locale, self.knowledge.version, self.images.version if self.images else None)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            record = self.knowledge[career_id]
+            image = self.images.url(record.name, height, record.image) if self.images else record.image
+            fragment = self._fragments.setdefault(key, render(record, image, locale))
+        return fragment
+
+    def result_card(self, career_id, score, locale=DEFAULT_LOCALE):
+        return self._get('result', result_card, career_id, 160, locale).replace('{score}', f"{score}")
+
+    def roadmap(self, career_id, locale=DEFAULT_LOCALE):
+        return self._get('roadmap', roadmap, career_id, 280, locale)
+
+    def __len__(self):
+        return len(self._fragments)
@@ -0,0 +1,254 @@
+import argparse
+import time
+
+import numpy as np
+
+from data import FIELDS, logic_map
+from forest import FlatForest
+from scoring import TOP_K, boost_batch, get_careers, get_encoder, predict_proba, top_k
+
+CANDIDATES = 32  # careers passed to the model per profile
+# Weight of a matching answer: a career's core interests and primary strength count double
+CORE, AFFINITY, PRIMARY, SECONDARY = 2.0, 1.0, 2.0, 1.0
+FIELD = 0.5  # preferred field: only breaks ties between careers matched on interests / strengths
+
+
+def profile_tokens(profile):
+    """Interest and strength answers as feature-style tokens: 'int_Coding', 'str_Logic'."""
+    return [f"int_{i}" for i in profile.get('interests', ())] + [f"str_{s}" for s in profile.get('strengths', ())]
+
+
+# --- 1. INVERTED INDEX (answer token -> careers) ---
+class CandidateIndex:
+    """Posting lists from interest / strength tokens to the career ids they point at.
+
+    Built once from logic_map-style specs (core and affinity interests, primary and secondary
+    strengths, preferred field). A profile's candidates are the careers with the highest
+    summed weight over its tokens: a few posting-list concatenations and one bincount, so
+    the cost grows with the answers given, not with the size of the catalogue. Careers the
+    model ranks but the specs do not describe are always candidates; a profile that matches
+    too few careers gets all of them, i.e. falls back to full scoring.
+    """
+
+    __slots__ = ('tokens', 'indptr', 'postings', 'weights', 'fields', 'always', 'everything')
+
+    def __init__(self, specs, careers):
+        lists = {}
+        field_of = np.full(len(careers), None, dtype=object)
+        for name, (core_i, aff_i, pri_s, sec_s, field) in specs.items():
+            career_id = careers.get_id(name)
+            if career_id is None:
+                continue
+            field_of[career_id] = field
+            for prefix, values, weight in (('int_', core_i, CORE), ('int_', aff_i, AFFINITY),
+                                           ('str_', pri_s, PRIMARY), ('str_', sec_s, SECONDARY)):
+                for value in values:
+                    posting = lists.setdefault(prefix + value, {})
+                    posting[career_id] = max(posting.get(career_id, 0.0), weight)
+        self.tokens = {token: row for row, token in enumerate(lists)}
+        self.indptr = np.cumsum([0] + [len(p) for p in lists.values()])
+        self.postings = np.array([c for p in lists.values() for c in p], dtype=np.intp)
+        self.weights = np.array([w for p in lists.values() for w in p.values()], dtype=np.float64)
+        # A field's postings would hold a quarter of the catalogue; a per-field bonus vector is cheaper
+        self.fields = {f: FIELD * ((field_of == f) | (field_of == 'Any')) for f in set(field_of) - {None, 'Any'}}
+        self.everything = np.arange(len(careers))
+        self.always = np.setdiff1d(self.everything, self.postings)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def candidates(self, profile, limit=CANDIDATES, k=TOP_K):
+        """Sorted ids of the (at most `limit`, plus `always`) careers worth scoring for `profile`."""
+        rows = [self.tokens[t] for t in profile_tokens(profile) if t in self.tokens]
+        if rows:
+            spans = [slice(self.indptr[r], self.indptr[r + 1]) for r in rows]
+            ids = np.concatenate([self.postings[s] for s in spans])
+            score = np.bincount(ids, np.concatenate([self.weights[s] for s in spans]), minlength=len(self.everything))
+            hits = (score > 0).nonzero()[0]  # faster than flatnonzero on floats
+            if len(hits) > limit:
+                bonus = self.fields.get(profile.get('field'))
+                s = score[hits] if bonus is None else score[hits] + bonus[hits]
+                # Best `limit` by weight; ties at the cut go to the lower ids, so the set is deterministic
+                cut = np.partition(s, len(s) - limit)[len(s) - limit]
+                above = hits[s > cut]
+                hits = np.concatenate([above, hits[s == cut][:limit - len(above)]])
+            cand = np.union1d(hits, self.always)
+            if len(cand) >= k:
+                return cand
+        return self.everything
+
+
+def get_index(bundle, specs=None):
+    if 'index' not in bundle:
+        bundle['index'] = CandidateIndex(logic_map if specs is None else specs, get_careers(bundle))
+    return bundle['index']
+
+
+# --- 2. SCORING ONLY THE CANDIDATES ---
+def pad_candidates(cands):
+    """Ragged candidate id lists as an (N x widest) id matrix plus the mask of real entries."""
+    lengths = np.array([len(c) for c in cands])
+    mask = np.arange(lengths.max()) < lengths[:, np.newaxis]
+    ids = np.zeros(mask.shape, dtype=np.intp)
+    ids[mask] = np.concatenate(cands)
+    return ids, mask
+
+
+def candidate_proba(model, X, ids):
+    """Each row's class probabilities over its own candidate columns (an N x width id matrix)."""
+    if isinstance(model, FlatForest):
+        # Trees are walked once for the batch and the candidates' leaf values gathered in one
+        # (N x trees x width) index, summed tree by tree as in FlatForest.predict_proba
+        leaves = model.apply(X)
+        return model.value[leaves[:, :, np.newaxis], ids[:, np.newaxis, :]].sum(axis=1) / model.n_trees
+    # Other learners (e.g. a streaming model) compute every class anyway
+    return np.take_along_axis(predict_proba(model, X), ids, axis=1)
+
+
+def score_candidates(profiles, bundle, index=None, limit=CANDIDATES, k=TOP_K):
+    """score_profiles with each profile's model call restricted to its retrieved candidates.
+
+    Same output format. Scores differ from full scoring only through the pruned careers'
+    share of the softmax, which boost_batch approximates; ties keep the highest-id-first order.
+    """
+    index = get_index(bundle) if index is None else index
+    encoder = get_encoder(bundle)
+    names = get_careers(bundle).names
+    profiles = list(profiles)
+    if not profiles:
+        return []
+    X = encoder.encode(profiles[0]) if len(profiles) == 1 else encoder.encode_batch(profiles)
+    ids, mask = pad_candidates([index.candidates(profile, limit, k) for profile in profiles])
+    probs = np.where(mask, candidate_proba(bundle['model'], X, ids), -np.inf)
+    # Every row has at least k candidates, and padding (score 0) sorts after all of them
+    ranked = top_k(boost_batch(probs, pruned=len(names) - mask.sum(axis=1)), k)
+    ids = np.take_along_axis(ids, ranked['id'], axis=1)
+    return [[{"id": idx, "career": names[idx], "score": score} for idx, score in zip(row_ids, row_scores)]
+            for row_ids, row_scores in zip(ids.tolist(), ranked['score'].tolist())]
+
+
+# --- 3. SYNTHETIC CATALOGUE & BENCHMARK ---
+def synthetic_specs(n_careers, seed=0, interests=None, strengths=40):
+    """logic_map-style specs for `n_careers` made-up careers over Zipf-popular tokens."""
+    rng = np.random.default_rng(seed)
+    interests = interests or max(60, n_careers // 8)
+    # A few tokens are shared by many careers: the most popular interest by ~20% of them and
+    # the most popular strength by ~30%, like "Tech" and "Attention to Detail" in logic_map
+    int_p, str_p = (1 / np.arange(5, n + 5) for n in (interests, strengths))
+    specs = {}
+    for c in range(n_careers):
+        ints = [f"Interest {i}" for i in rng.choice(interests, 5, replace=False, p=int_p / int_p.sum())]
+        strs = [f"Strength {s}" for s in rng.choice(strengths, 3, replace=False, p=str_p / str_p.sum())]
+        specs[f"Career {c:05d}"] = (ints[:2], ints[2:], strs[:1], strs[1:], FIELDS[rng.integers(len(FIELDS))])
+    return specs
+
+
+def synthetic_bundle(specs, rows_per_career, trees, leaves, depth, seed=0):
+    """Fit a small forest on rows sampled from `specs`; returns (bundle, held-out profiles)."""
+    import pandas as pd
+    from data import sample_career
+    from scoring import frame_profiles
+    from train import encode, fit
+
+    rng = np.random.default_rng(seed)
+    df = pd.concat([sample_career(name, rows_per_career + 1, rng, spec) for name, spec in specs.items()],
+                   ignore_index=True)
+    held_out = df.groupby('career').head(1)
+    train_df = df.drop(held_out.index).reset_index(drop=True)
+    X, y, encoders = encode(train_df)
+    model = fit(X, y, {'n_estimators': trees, 'max_leaf_nodes': leaves, 'max_depth': depth}, n_jobs=-1, seed=seed)
+    bundle = dict(encoders, model=FlatForest.from_model(model))
+    return bundle, frame_profiles(held_out.reset_index(drop=True)), held_out['career'].tolist()
+
+
+def compare(bundle, profiles, limits, k=TOP_K, index=None, truth=None):
+    """Time full vs candidate scoring, one profile per call and as one batch, per candidate limit.
+
+    Agreement is judged on the full model's scores of the careers pruning picked: careers the
+    model scores alike tie in full scoring and come out by id, so any one of them is a match.
+    """
+    from scoring import score_profiles
+    index = get_index(bundle) if index is None else index
+    full_scores = np.round(boost_batch(predict_proba(bundle['model'], get_encoder(bundle).encode_batch(profiles))), 1)
+    best = -np.sort(-full_scores, axis=1)[:, :k]
+
+    def per_profile(fn, batch):
+        start = time.perf_counter()
+        out = fn(profiles) if batch else [fn([p])[0] for p in profiles]
+        return out, (time.perf_counter() - start) / len(profiles) * 1e3
+
+    _, full_ms = per_profile(lambda ps: score_profiles(ps, bundle, k), False)
+    _, full_batch_ms = per_profile(lambda ps: score_profiles(ps, bundle, k), True)
+    rows = []
+    for limit in limits:
+        start = time.perf_counter()
+        cands = [index.candidates(p, limit, k) for p in profiles]
+        retrieve_us = (time.perf_counter() - start) / len(profiles) * 1e6
+        pruned, pruned_ms = per_profile(lambda ps: score_candidates(ps, bundle, index, limit, k), False)
+        _, pruned_batch_ms = per_profile(lambda ps: score_candidates(ps, bundle, index, limit, k), True)
+        got = np.array([[full_scores[r, item['id']] for item in ranking] for r, ranking in enumerate(pruned)])
+        row = {
+            'limit': limit, 'candidates': float(np.mean([len(c) for c in cands])), 'retrieve_us': retrieve_us,
+            'ms': pruned_ms, 'batch_ms': pruned_batch_ms,
+            'top1': np.mean(got[:, 0] == best[:, 0]), 'topk': np.mean((got == best).all(axis=1)),
+        }
+        if truth is not None:
+            names = get_careers(bundle)
+            row['recall'] = np.mean([names.id(t) in c for c, t in zip(cands, truth)])
+        rows.append(row)
+    return {'profiles': len(profiles), 'careers': len(get_careers(bundle)), 'tokens': len(index),
+            'ms': full_ms, 'batch_ms': full_batch_ms}, rows
+
+
+def print_report(full, rows):
+    print(f"{full['careers']} careers, {full['tokens']} index tokens, {full['profiles']} profiles")
+    print(f"{'':28s}  {'per request':>12s}  {'in a batch':>11s}  {'top-1':>6s}  {'top-k':>6s}  {'recall':>6s}")
+    print(f"{'full scoring':>28s}  {full['ms']:9.3f} ms  {full['batch_ms']:8.3f} ms")
+    for r in rows:
+        recall = f"  {r['recall']:6.1%}" if 'recall' in r else ""
+        print(f"{r['candidates']:6.1f} candidates ({r['retrieve_us']:5.1f} us)  {r['ms']:9.3f} ms  "
+              f"{r['batch_ms']:8.3f} ms  {r['top1']:6.1%}  {r['topk']:6.1%}{recall}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Candidate retrieval before model scoring: check and benchmark.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    chk = sub.add_parser('check', help="full vs candidate scoring with the trained model")
+    chk.add_argument('--model', help="career_model.pkl or an artifact directory (default: auto)")
+    chk.add_argument('--data', default='newdata.csv')
+    chk.add_argument('-n', '--profiles', type=int, default=500)
+    chk.add_argument('--limit', type=int, nargs='+', default=[6, 12])
+    bench = sub.add_parser('bench', help="the same on a synthetic catalogue")
+    bench.add_argument('--careers', type=int, default=5000)
+    bench.add_argument('--rows', type=int, default=8, help="training rows per career")
+    bench.add_argument('--trees', type=int, default=8)
+    bench.add_argument('--leaves', type=int, default=1024, help="max_leaf_nodes per tree (leaf values are dense "
+                                                                "over all careers, so memory grows with both)")
+    bench.add_argument('--depth', type=int, default=40, help="max_depth (the trained model reaches 34)")
+    bench.add_argument('--limit', type=int, nargs='+', default=[CANDIDATES, 128])
+    bench.add_argument('-n', '--profiles', type=int, default=500)
+    bench.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'check':
+        from scoring import load_bundle, read_profiles
+        rng = np.random.default_rng(0)
+        profiles = read_profiles(args.data)
+        profiles = [profiles[i] for i in rng.choice(len(profiles), min(args.profiles, len(profiles)), replace=False)]
+        print_report(*compare(load_bundle(args.model), profiles, args.limit))
+        return
+    specs = synthetic_specs(args.careers, args.seed)
+    start = time.perf_counter()
+    bundle, profiles, truth = synthetic_bundle(specs, args.rows, args.trees, args.leaves, args.depth, args.seed)
+    print(f"synthetic model: {args.trees} trees over {len(bundle['features'])} features "
+          f"fitted in {time.perf_counter() - start:.1f}s")
+    start = time.perf_counter()
+    index = get_index(bundle, specs)
+    print(f"index built in {(time.perf_counter() - start) * 1e3:.1f} ms")
+    picks = np.random.default_rng(args.seed).choice(len(profiles), min(args.profiles, len(profiles)), replace=False)
+    print_report(*compare(bundle, [profiles[i] for i in picks], args.limit, index=index,
+                          truth=[truth[i] for i in picks]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+import argparse
+import functools
+import os
+import warnings
+
+import joblib
+import numpy as np
+
+from artifact import ARTIFACT_DIR, is_artifact, load_artifact
+from careers import CareerRegistry
+from features import CAT_FIELDS, FeatureEncoder
+from forest import FlatForest
+from registry import ModelRegistry
+
+# --- 1. MODEL BUNDLE ---
+MODEL_PATH = 'career_model.pkl'
+TEMPERATURE = 0.25  # Sharpness factor
+TOP_K = 3
+
+
+def default_model_path():
+    # The registry's active version once models/ exists (registry.py publish); before that the
+    # memory-mapped artifact train.py writes, and the pickle only when there is no artifact
+    registry = ModelRegistry()
+    if registry.exists():
+        _, path = registry.current()
+        if path:
+            return path
+    return ARTIFACT_DIR if is_artifact(ARTIFACT_DIR) else MODEL_PATH
+
+
+def load_bundle(path=None):
+    """Load the dict written by model.ipynb: model, le, mlb_int, mlb_str, features.
+
+    `path` may also be an artifact directory, in which case the model is a FlatForest
+    over the memory-mapped node arrays instead of the unpickled sklearn forest. Bundles are
+    cached per resolved path and version, so a model re-exported or retrained in place (or a
+    newly activated registry version) is loaded on the next call instead of served stale.
+    """
+    path = path or default_model_path()
+    return _cached_bundle(path, model_version(path))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_bundle(path, version):
+    return read_bundle(path)
+
+
+def read_bundle(path):
+    """load_bundle without the cache: a fresh bundle on every call."""
+    if is_artifact(path):
+        meta = load_artifact(path)
+        bundle = {'model': FlatForest.from_artifact(meta), 'le': meta['le'], 'mlb_int': meta['mlb_int'],
+                  'mlb_str': meta['mlb_str'], 'features': meta['features']}
+    else:
+        bundle = joblib.load(path)
+    bundle['encoder'] = FeatureEncoder(bundle['features'])
+    bundle['careers'] = CareerRegistry(bundle['le'].classes_)
+    bundle['version'] = model_version(path)
+    return bundle
+
+
+def model_version(path):
+    # Changes whenever the bundle is re-exported, so caches keyed on it never go stale
+    stamp = os.stat(os.path.join(path, 'meta.json') if os.path.isdir(path) else path).st_mtime_ns
+    return f"{os.path.basename(os.path.normpath(path))}@{stamp}"
+
+
+# --- 2. FEATURE MATRIX ---
+def get_encoder(bundle):
+    if 'encoder' not in bundle:
+        bundle['encoder'] = FeatureEncoder(bundle['features'])
+    return bundle['encoder']
+
+
+def get_careers(bundle):
+    if 'careers' not in bundle:
+        bundle['careers'] = CareerRegistry(bundle['le'].classes_)
+    return bundle['careers']
+
+
+def predict_proba(model, X):
+    # The forest was fitted on a DataFrame; a bare matrix in the same column order is equivalent
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='X does not have valid feature names')
+        return model.predict_proba(X)
+
+
+# --- 3. 70-100% TEMPERATURE BOOST LOGIC ---
+RANKING_DTYPE = np.dtype([('id', np.intp), ('score', np.float64)])
+
+
+def boost_scores(raw_probs, T=TEMPERATURE):
+    """Single-row reference for boost_batch (the original app.py logic)."""
+    exp_p = np.exp(raw_probs / T)
+    boosted_p = (exp_p / np.sum(exp_p)) * 100
+
+    # Calibration floor
+    top_idx = np.argmax(boosted_p)
+    if boosted_p[top_idx] < 75: boosted_p = np.clip(boosted_p * (85/boosted_p[top_idx]), 0, 98.4)
+    return boosted_p
+
+
+def boost_batch(probs, T=TEMPERATURE, pruned=0):
+    """boost_scores over every row of an (N x classes) probability matrix at once.
+
+    `pruned` classes left out of `probs` (candidate retrieval, see retrieval.py) still enter
+    the softmax denominator, to first order: each adds exp(p / T) ~ 1 + p / T, and their
+    probabilities sum to whatever the kept columns leave of 1. `pruned` may be one count per
+    row; -inf entries pad rows to a common width and score 0.
+    """
+    probs = np.asarray(probs, dtype=np.float64)
+    exp_p = np.exp(probs / T)
+    norm = np.sum(exp_p, axis=1, keepdims=True)
+    if np.any(pruned):
+        kept = np.sum(probs, axis=1, keepdims=True, where=probs > -np.inf)
+        norm += np.reshape(pruned, (-1, 1)) + np.clip(1 - kept, 0, None) / T
+    boosted = (exp_p / norm) * 100
+
+    # Calibration floor, only on rows whose best career is under 75
+    top = boosted.max(axis=1, keepdims=True)
+    low = top[:, 0] < 75
+    boosted[low] = np.clip(boosted[low] * (85 / top[low]), 0, 98.4)
+    return boosted
+
+
+def top_k(scores, k=TOP_K):
+    """Best k columns of each row as an (N x k) RANKING_DTYPE array, best first.
+
+    np.partition finds each row's k-th best score in linear time and only the k selected
+    columns are sorted. Equal scores come highest id first, as from a stable
+    argsort(...)[::-1], also for ties straddling the cut.
+    """
+    n, m = scores.shape
+    k = min(k, m)
+    cut = np.partition(scores, m - k, axis=1)[:, m - k, np.newaxis]
+    above = scores > cut
+    tied = scores == cut
+    # Of the columns tied with the cut, keep the right-most ones that still fit
+    room = k - above.sum(axis=1, keepdims=True)
+    keep = above | (tied & (np.cumsum(tied[:, ::-1], axis=1)[:, ::-1] <= room))
+    cand = np.nonzero(keep)[1].reshape(n, k)
+    rows = np.arange(n)[:, np.newaxis]
+    order = np.lexsort((-cand, -scores[rows, cand]), axis=1)
+    ranked = np.empty((n, k), dtype=RANKING_DTYPE)
+    ranked['id'] = cand[rows, order]
+    ranked['score'] = np.round(scores[rows, ranked['id']], 1)
+    return ranked
+
+
+def score_profiles(profiles, bundle=None, k=TOP_K):
+    """Rank careers for many profiles with a single predict_proba call.
+
+    Each profile is a dict with the keys of CAT_FIELDS plus 'interests' and 'strengths'
+    lists. Returns one list of {"id", "career", "score"} dicts (best first) per profile,
+    where "id" is the career's CareerRegistry id.
+    """
+    if bundle is None:
+        bundle = load_bundle()
+    profiles = list(profiles)
+    if not profiles:
+        return []
+    encoder = get_encoder(bundle)
+    X = encoder.encode(profiles[0]) if len(profiles) == 1 else encoder.encode_batch(profiles)
+    ranked = rank_probabilities(predict_proba(bundle['model'], X), k)
+    names = get_careers(bundle).names
+    return [[{"id": idx, "career": names[idx], "score": score} for idx, score in zip(row_ids, row_scores)]
+            for row_ids, row_scores in zip(ranked['id'].tolist(), ranked['score'].tolist())]
+
+
+def rank_probabilities(probs, k=TOP_K):
+    """Boost predict_proba output and keep each row's top k (see top_k)."""
+    return top_k(boost_batch(probs), k)
+
+
+def rank_rows(probs, k=TOP_K):
+    """Per-row reference for rank_probabilities: boost_scores and a full argsort per row.
+
+    The sort is stable so ties have a defined order (the default quicksort orders them
+    arbitrarily, which made app.py's choice among equally scored careers unpredictable).
+    """
+    ranked = np.empty((len(probs), min(k, np.shape(probs)[1])), dtype=RANKING_DTYPE)
+    for r, raw_probs in enumerate(np.asarray(probs, dtype=np.float64)):
+        boosted_p = boost_scores(raw_probs)
+        top = np.argsort(boosted_p, kind='stable')[-k:][::-1]
+        ranked[r] = list(zip(top, np.round(boosted_p[top], 1)))
+    return ranked
+
+
+# --- 4. BATCH CLI ---
+def split_list(x): return [i.strip() for i in str(x).split(',') if i.strip()]
+
+
+def read_profiles(path):
+    """Read profiles from a CSV in the newdata.csv schema (the career column is optional)."""
+    import pandas as pd
+    return frame_profiles(pd.read_csv(path))
+
+
+def frame_profiles(df):
+    profiles = df[[c for c in CAT_FIELDS if c in df.columns]].to_dict('records')
+    for profile, ints, strs in zip(profiles, df['interests'], df['strengths']):
+        profile['interests'] = split_list(ints)
+        profile['strengths'] = split_list(strs)
+    return profiles
+
+
+def main(argv=None):
+    import time
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Score a cohort of questionnaire profiles in one batch.")
+    parser.add_argument('profiles', help="CSV with field, education, learning_rate, time_horizon, "
+                                         "risk_tolerance, interests, strengths columns")
+    parser.add_argument('-o', '--output', default='rankings.csv')
+    parser.add_argument('--model', help="career_model.pkl or an artifact directory (default: auto)")
+    parser.add_argument('-k', '--top', type=int, default=TOP_K)
+    parser.add_argument('--check', action='store_true',
+                        help="also compare the vectorized ranking with the per-row reference")
+    args = parser.parse_args(argv)
+
+    profiles = read_profiles(args.profiles)
+    start = time.perf_counter()
+    rankings = score_profiles(profiles, load_bundle(args.model), k=args.top)
+    elapsed = time.perf_counter() - start
+
+    rows = []
+    for ranking in rankings:
+        row = {}
+        for rank, item in enumerate(ranking, 1):
+            row[f"career_{rank}"] = item["career"]
+            row[f"score_{rank}"] = item["score"]
+        rows.append(row)
+    pd.DataFrame(rows).to_csv(args.output, index=False)
+    print(f"Scored {len(profiles)} profiles in {elapsed:.3f}s -> {args.output}")
+
+    if args.check:
+        bundle = load_bundle(args.model)
+        probs = predict_proba(bundle['model'], get_encoder(bundle).encode_batch(profiles))
+        timings = {}
+        for name, fn in (('vectorized', rank_probabilities), ('per-row', rank_rows)):
+            start = time.perf_counter()
+            timings[name] = (fn(probs, args.top), time.perf_counter() - start)
+        (fast, t_fast), (ref, t_ref) = timings['vectorized'], timings['per-row']
+        mismatches = int((fast != ref).any(axis=1).sum())
+        print(f"boost + top-{args.top}: vectorized {t_fast * 1e3:.1f} ms, per-row {t_ref * 1e3:.1f} ms, "
+              f"{mismatches} mismatched rows")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+import argparse
+import asyncio
+import json
+import logging
+import mimetypes
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import namedtuple
+from http import HTTPStatus
+from urllib.parse import unquote, urlsplit
+
+from batching import MicroBatcher
+from cache import RankingCache, profile_key
+from features import CAT_FIELDS, MULTI_FIELDS
+from images import HASHED, STATIC_DIR
+from knowledge import KnowledgeBase
+from retrieval import score_candidates
+from scoring import TOP_K, default_model_path, get_careers, load_bundle, score_profiles
+
+log = logging.getLogger('pathwise.server')
+MAX_BODY = 10 * 1024 * 1024
+MAX_BATCH = 10_000
+# Content-hashed file names never change meaning, so browsers may keep them for a year
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, max-age=300"
+
+StaticFile = namedtuple('StaticFile', 'body content_type cache_control')
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --- 1. SCORING WORKERS (each process opens the same model bundle) ---
+_worker_bundle = None
+
+
+def _init_worker(model_path):
+    global _worker_bundle
+    _worker_bundle = load_bundle(model_path)
+
+
+def local_executor(model_path):
+    """Score on one thread of this process, e.g. a pre-forked worker (prefork.py) that already holds the bundle."""
+    _init_worker(model_path)
+    return ThreadPoolExecutor(1, thread_name_prefix='score')
+
+
+def _score(profiles, k, candidates=0):
+    if candidates:
+        return score_candidates(profiles, _worker_bundle, limit=candidates, k=k)
+    return score_profiles(profiles, _worker_bundle, k)
+
+
+def validate_profile(profile):
+    if not isinstance(profile, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "profile must be a JSON object")
+    for key in MULTI_FIELDS:
+        values = profile.get(key)
+        if not isinstance(values, list) or not values:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{key}' must be a non-empty list")
+        if not all(isinstance(v, str) for v in values):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{key}' must be a list of strings")
+    for key in CAT_FIELDS:
+        # Optional, but hashed into the cache key and looked up as answers, so strings only
+        if profile.get(key) is not None and not isinstance(profile[key], str):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{key}' must be a string")
+    return profile
+
+
+# --- 2. ASYNC HTTP/1.1 SERVER ---
+class RankingServer:
+    """JSON API over asyncio streams; CPU-bound scoring runs in a process pool off the event loop.
+
+    POST /rank         {"profile": {...}}           -> {"careers": [...]}
+    POST /rank:batch   {"profiles": [{...}, ...]}   -> {"rankings": [[...], ...]}
+    GET  /roadmap/{career name or id}               -> merged KnowledgeBase record
+    GET  /healthz                                   -> model version, cache and batching metrics
+    GET  /static/{path}                             -> thumbnails and other files under static/
+
+    With `batch_delay` > 0, concurrent /rank requests are coalesced by a MicroBatcher into
+    one predict_proba call per batch instead of one per request. With `candidates` set, each
+    profile is scored against only that many careers retrieved from the CandidateIndex.
+    """
+
+    def __init__(self, model_path=None, workers=None, executor=None, max_batch=64, batch_delay=0.002,
+                 static_dir=STATIC_DIR, candidates=0):
+        self.model_path = model_path or default_model_path()
+        self.static_dir = os.path.realpath(static_dir)
+        self.bundle = load_bundle(self.model_path)
+        self.careers = get_careers(self.bundle)
+        self.knowledge = KnowledgeBase(self.careers)
+        self.executor = executor or ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                        initargs=(self.model_path,))
+        self.cache = RankingCache(maxsize=16384)
+        self.candidates = candidates
+        self.batcher = None
+        if batch_delay > 0:
+            self.batcher = MicroBatcher(
+                lambda profiles: self.executor.submit(_score, profiles, TOP_K, candidates).result(),
+                max_batch, batch_delay, concurrency=workers or os.cpu_count())
+
+    async def rank(self, profiles, k=TOP_K):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _score, profiles, k, self.candidates)
+
+    async def rank_one(self, profile):
+        key = profile_key(validate_profile(profile), self.bundle['version'])
+        ranking = self.cache.get(key)
+        if ranking is None:
+            if self.batcher is not None:
+                ranking = await asyncio.wrap_future(self.batcher.submit(profile))
+            else:
+                ranking = (await self.rank([profile]))[0]
+            self.cache.put(key, ranking)
+        return ranking
+
+    async def dispatch(self, method, target, body):
+        path = urlsplit(target).path
+        if path == '/healthz' and method == 'GET':
+            return {"status": "ok", "model": self.bundle['version'], "cache": self.cache.stats(),
+                    "batching": self.batcher.metrics.snapshot() if self.batcher else None}
+        if path.startswith('/static/') and method == 'GET':
+            return self.static_file(unquote(path[len('/static/'):]))
+        if path.startswith('/roadmap/') and method == 'GET':
+            career = unquote(path[len('/roadmap/'):])
+            # isdigit() alone accepts '²' and other non-ASCII digits that int() rejects
+            career_id = int(career) if career.isascii() and career.isdigit() else self.careers.get_id(career)
+            if career_id is None or career_id >= len(self.knowledge):
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"unknown career {career!r}")
+            return self.knowledge[career_id].payload
+        if path in ('/rank', '/rank:batch'):
+            if method != 'POST':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+            try:
+                payload = json.loads(body or b'{}')
+            except ValueError:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "body is not valid JSON")
+            if not isinstance(payload, dict):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "body must be a JSON object")
+            if path == '/rank':
+                return {"careers": await self.rank_one(payload.get('profile'))}
+            profiles = payload.get('profiles')
+            if not isinstance(profiles, list) or len(profiles) > MAX_BATCH:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"'profiles' must be a list of at most {MAX_BATCH}")
+            return {"rankings": await self.rank([validate_profile(p) for p in profiles])}
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"no route for {method} {path}")
+
+    def static_file(self, name):
+        path = os.path.realpath(os.path.join(self.static_dir, name))
+        if not path.startswith(self.static_dir + os.sep) or not os.path.isfile(path):
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"no static file {name!r}")
+        with open(path, 'rb') as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        return StaticFile(body, content_type, IMMUTABLE if HASHED.search(path) else REVALIDATE)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, target, version = line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = header.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+                if length > MAX_BODY:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length)
+                    try:
+                        status, payload = HTTPStatus.OK, await self.dispatch(method, target, body)
+                    except HTTPError as e:
+                        status, payload = e.status, {"error": str(e)}
+                    except Exception:
+                        log.exception("%s %s failed", method, target)
+                        status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"}
+                writer.write(self.response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def response(status, payload, keep_alive):
+        head = [f"HTTP/1.1 {status.value} {status.phrase}"]
+        if isinstance(payload, StaticFile):
+            body = payload.body
+            head += [f"Content-Type: {payload.content_type}", f"Cache-Control: {payload.cache_control}"]
+        else:
+            # bytes are a pre-encoded JSON body
+            body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+            head.append("Content-Type: application/json")
+        head += [f"Content-Length: {len(body)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        return ("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + body
+
+    async def serve(self, host='127.0.0.1', port=8000, sock=None):
+        # `sock`: an already listening socket shared by several processes (prefork.py)
+        if sock is None:
+            server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        else:
+            server = await asyncio.start_server(self.handle, sock=sock, backlog=1024)
+        log.info("serving %s on %s", self.bundle['version'],
+                 ', '.join(str(s.getsockname()) for s in server.sockets))
+        # SIGTERM stops cleanly too, so main() can shut the scoring processes down
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+        async with server:
+            await stop.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve career rankings over a JSON HTTP API.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--model', help="career_model.pkl or an artifact directory (default: auto)")
+    parser.add_argument('--workers', type=int, help="scoring processes (default: all cores)")
+    parser.add_argument('--max-batch', type=int, default=64, help="most /rank requests scored together")
+    parser.add_argument('--batch-delay-ms', type=float, default=2.0,
+                        help="longest a /rank request waits for others to batch with (0 disables)")
+    parser.add_argument('--candidates', type=int, default=0,
+                        help="score only this many retrieved careers per profile (0: all, the default; only "
+                             "faster for catalogues of thousands of careers, see retrieval.py)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    server = RankingServer(args.model, args.workers, max_batch=args.max_batch,
+                           batch_delay=args.batch_delay_ms / 1000, candidates=args.candidates)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    finally:
+        if server.batcher is not None:
+            server.batcher.close()
+        server.executor.shutdown(cancel_futures=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+import argparse
+import functools
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from careers import CareerRegistry
+from features import FeatureEncoder
+from ingest import CHUNK_ROWS, Vocabulary, encode_chunk, iter_chunks
+
+INDEX_DIR = 'profile_index'
+DATA_PATH = 'newdata.csv'
+INDEX_FORMAT = 1
+NEIGHBOURS = 50
+SEARCH_ROWS = 8192  # stored profiles compared per step; temporaries are rows x queries x words
+METRICS = ('jaccard', 'hamming')
+
+# --- 1. PACKED BITSETS ---
+if hasattr(np, 'bitwise_count'):
+    popcount = np.bitwise_count
+else:
+    _BYTE_BITS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def popcount(words):
+        words = np.ascontiguousarray(words)
+        return _BYTE_BITS[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1, dtype=np.uint8)
+
+
+def n_words(n_features):
+    return (n_features + 63) // 64
+
+
+def pack(X, n_features):
+    """0/1 rows (dense or CSR) -> (rows, words) little-endian uint64; bit j is feature column j."""
+    dense = X.toarray() if hasattr(X, 'toarray') else np.asarray(X)
+    packed = np.packbits(dense.astype(bool), axis=1, bitorder='little')
+    out = np.zeros((len(dense), n_words(n_features) * 8), dtype=np.uint8)
+    out[:, :packed.shape[1]] = packed
+    return out.view('<u8')
+
+
+def unpack(bits, n_features, dtype=np.float32):
+    """Inverse of pack: (rows, n_features) 0/1 matrix."""
+    words = np.ascontiguousarray(bits, dtype='<u8')
+    return np.unpackbits(words.view(np.uint8), axis=1, count=n_features, bitorder='little').astype(dtype)
+
+
+def bit_counts(bits):
+    return popcount(bits).sum(axis=1, dtype=np.uint16)
+
+
+# --- 2. TOP-K SEARCH (one process, or one shard of the store) ---
+ROW_BITS = 40  # a search key is (similarity rank << ROW_BITS) | inverted row, unique per stored row
+
+
+@functools.lru_cache(maxsize=None)
+def similarity_ranks(n_features, metric):
+    """(rank table indexed [intersection, union], score of each rank), ranks ascending with similarity.
+
+    Jaccard is intersection / union of at most `n_features` bits, so every value is one of a
+    few thousand fractions; ranking them exactly turns comparisons into integer ones.
+    """
+    inter, union = np.ogrid[:n_features + 1, :n_features + 1]
+    if metric == 'jaccard':
+        values = np.divide(inter, union, out=np.ones((n_features + 1, n_features + 1)), where=union > 0)
+    else:
+        # Hamming distance = union - intersection, ranked from the largest down
+        values = -(union - inter).astype(np.float64)
+    scores, ranks = np.unique(values, return_inverse=True)
+    return ranks.reshape(values.shape).astype(np.int64), scores
+
+
+def search_bits(bits, counts, queries, k=NEIGHBOURS, metric='jaccard', start=0, stop=None, step=SEARCH_ROWS,
+                n_features=None):
+    """Nearest stored rows [start, stop) to each packed query, as (scores, rows), best first.
+
+    Scores are Jaccard similarities, or negated Hamming distances, so higher is always better;
+    equally similar rows come in store order. Each step ANDs a block of stored rows with all
+    queries word by word and popcounts, so memory stays at one block whatever the store size.
+    """
+    stop = len(bits) if stop is None else stop
+    queries = np.asarray(queries)
+    ranks, rank_scores = similarity_ranks(n_features or queries.shape[1] * 64, metric)
+    q_counts = bit_counts(queries).astype(np.int64)[:, np.newaxis]
+    row_mask = (1 << ROW_BITS) - 1
+    keys = []
+    for lo in range(start, stop, step):
+        block = np.asarray(bits[lo:min(lo + step, stop)])
+        inter = sum(popcount(np.bitwise_and.outer(queries[:, w], block[:, w])).astype(np.int64)
+                    for w in range(queries.shape[1]))
+        union = q_counts + np.asarray(counts[lo:lo + len(block)], dtype=np.int64) - inter
+        key = (ranks[inter, union] << ROW_BITS) | (row_mask - np.arange(lo, lo + len(block)))
+        if key.shape[1] > k:
+            key = np.take_along_axis(key, np.argpartition(key, -k, axis=1)[:, -k:], axis=1)
+        keys.append(key)
+    if not keys:
+        return np.empty((len(queries), 0)), np.empty((len(queries), 0), dtype=np.int64)
+    key = -np.sort(-np.hstack(keys), axis=1)[:, :k]
+    return rank_scores[key >> ROW_BITS], row_mask - (key & row_mask)
+
+
+# --- 3. PROFILE STORE ---
+def encode_rows(paths, vocab, chunksize=CHUNK_ROWS):
+    """Yield (packed bits, career ids) chunk by chunk for CSVs in the newdata.csv schema."""
+    for path in paths:
+        for chunk in iter_chunks(path, chunksize):
+            X, y = encode_chunk(chunk, vocab)
+            yield pack(X, len(vocab.features)), np.where(np.isnan(y.astype(float)), -1, y).astype(np.int16)
+
+
+def bundle_vocabulary(bundle):
+    # Columns in the bundle's own order, which after an incremental update is not the sorted one
+    return Vocabulary.from_bundle(bundle)
+
+
+def get_names(bundle):
+    from scoring import get_careers
+    return get_careers(bundle).names
+
+
+class ProfileIndex:
+    """Past profiles as packed uint64 bitsets over the model's one-hot features, with their careers.
+
+    A 126-feature profile is two words, so a million profiles take 16 MB and a query is a
+    pass of AND + popcount over them. Stores written by `build_index` are memory-mapped,
+    and `search` can split them into row shards scored by a pool from `shard_pool`.
+    """
+
+    def __init__(self, bits, careers, features, names, path=None, counts=None):
+        self.bits = bits
+        self.careers = careers
+        self.counts = bit_counts(bits) if counts is None else counts
+        self.features = list(features)
+        self.encoder = FeatureEncoder(self.features)
+        self.names = CareerRegistry(names)
+        self.path = path
+
+    @classmethod
+    def from_csv(cls, paths, bundle, chunksize=CHUNK_ROWS):
+        """In-memory store of every row of `paths`."""
+        vocab = bundle_vocabulary(bundle)
+        parts = list(encode_rows(paths, vocab, chunksize))
+        return cls(np.vstack([b for b, _ in parts]), np.concatenate([c for _, c in parts]),
+                   vocab.features, get_names(bundle))
+
+    @classmethod
+    def load(cls, path=INDEX_DIR, mmap_mode='r'):
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['format'] != INDEX_FORMAT:
+            raise ValueError(f"Unsupported profile index format {meta['format']} in {path}")
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                  for name in ('bits', 'careers', 'counts')}
+        return cls(arrays['bits'], arrays['careers'], meta['features'], meta['careers'], path, arrays['counts'])
+
+    def __len__(self):
+        return len(self.bits)
+
+    def encode(self, profiles):
+        return pack(self.encoder.encode_batch(profiles), len(self.features))
+
+    def search(self, profiles, k=NEIGHBOURS, metric='jaccard', pool=None, shards=None):
+        """The k most similar stored profiles to each profile, best first.
+
+        Returns one list of {"row", "id", "career", "similarity" or "distance"} dicts per
+        profile; equally similar rows come in store order. With a `pool` (see shard_pool)
+        the store is split into `shards` row ranges searched in parallel and merged.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {', '.join(METRICS)}")
+        queries = self.encode(profiles)
+        if pool is None:
+            scores, rows = search_bits(self.bits, self.counts, queries, k, metric, n_features=len(self.features))
+        else:
+            bounds = np.linspace(0, len(self), (shards or os.cpu_count()) + 1).astype(np.int64)
+            jobs = [pool.submit(_search_shard, queries, k, metric, lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+            parts = [job.result() for job in jobs]
+            scores, rows = np.hstack([s for s, _ in parts]), np.hstack([r for _, r in parts])
+            order = np.lexsort((rows, -scores), axis=1)[:, :k]
+            scores, rows = np.take_along_axis(scores, order, axis=1), np.take_along_axis(rows, order, axis=1)
+
+        ids = np.asarray(self.careers)[rows]
+        key = 'similarity' if metric == 'jaccard' else 'distance'
+        return [[{"row": r, "id": c, "career": self.names[c] if c >= 0 else None,
+                  key: round(s, 3) if metric == 'jaccard' else int(-s)}
+                 for r, c, s in zip(row_rows, row_ids, row_scores)]
+                for row_rows, row_ids, row_scores in zip(rows.tolist(), ids.tolist(), scores.tolist())]
+
+
+def save_index(index, out, model_version, sources):
+    os.makedirs(out, exist_ok=True)
+    for name in ('bits', 'careers', 'counts'):
+        np.save(os.path.join(out, f"{name}.npy"), getattr(index, name))
+    meta = {'format': INDEX_FORMAT, 'rows': len(index), 'features': index.features,
+            'careers': list(index.names.names), 'model_version': model_version, 'sources': list(sources)}
+    with open(os.path.join(out, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    return ProfileIndex.load(out)
+
+
+def build_index(paths, bundle, out=INDEX_DIR, chunksize=CHUNK_ROWS):
+    """Write the store for `paths` (e.g. newdata.csv plus assessment logs) as .npy columns."""
+    return save_index(ProfileIndex.from_csv(paths, bundle, chunksize), out, bundle['version'], paths)
+
+
+def career_shares(neighbours, top=3):
+    """'People like you chose': the most frequent careers among the neighbours, in percent."""
+    counts = Counter(n["id"] for n in neighbours if n["id"] >= 0)
+    names = {n["id"]: n["career"] for n in neighbours}
+    total = sum(counts.values())
+    return [{"id": c, "career": names[c], "share": round(100 * n / total)} for c, n in counts.most_common(top)]
+
+
+# --- 4. SHARDED SEARCH (one process per shard of a memory-mapped store) ---
+_worker_index = None
+
+
+def _init_worker(path):
+    global _worker_index
+    _worker_index = ProfileIndex.load(path)
+
+
+def _search_shard(queries, k, metric, start, stop):
+    return search_bits(_worker_index.bits, _worker_index.counts, queries, k, metric, start, stop,
+                       n_features=len(_worker_index.features))
+
+
+def shard_pool(path=INDEX_DIR, workers=None):
+    """Processes that each memory-map the store at `path` once, for ProfileIndex.search(pool=...)."""
+    return ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(path,))
+
+
+# --- 5. CHECK & BENCHMARK ---
+def brute_force(bits, queries, k, metric):
+    """Reference search on unpacked float matrices, for checking the bitset path."""
+    A = unpack(bits, bits.shape[1] * 64, np.float64)
+    Q = unpack(queries, queries.shape[1] * 64, np.float64)
+    inter = Q @ A.T
+    total = Q.sum(axis=1)[:, np.newaxis] + A.sum(axis=1)
+    if metric == 'jaccard':
+        scores = np.divide(inter, total - inter, out=np.ones(inter.shape), where=total - inter > 0)
+    else:
+        scores = -(total - 2 * inter)
+    order = np.lexsort((np.broadcast_to(np.arange(len(A)), scores.shape), -scores), axis=1)[:, :k]
+    return np.take_along_axis(scores, order, axis=1), order
+
+
+def synthetic_index(rows, bundle, out, seed=0):
+    """A store of `rows` generated profiles (data.py distribution), written to `out`."""
+    from data import generate_chunks
+    vocab = bundle_vocabulary(bundle)
+    parts = []
+    for chunk in generate_chunks(rows, seed):
+        X, y = encode_chunk(chunk, vocab)
+        parts.append((pack(X, len(vocab.features)), y.astype(np.int16)))
+    index = ProfileIndex(np.vstack([b for b, _ in parts]), np.concatenate([c for _, c in parts]),
+                         vocab.features, get_names(bundle))
+    return save_index(index, out, bundle['version'], ['synthetic'])
+
+
+def main(argv=None):
+    import time
+    from scoring import load_bundle, read_profiles
+
+    parser = argparse.ArgumentParser(description="Bitset nearest-neighbour search over past profiles.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    bld = sub.add_parser('build', help="pack CSVs of past profiles into a store")
+    bld.add_argument('data', nargs='+', help="CSVs in the newdata.csv schema (training data, assessment logs)")
+    bld.add_argument('--out', default=INDEX_DIR)
+    bld.add_argument('--model', help="career_model.pkl or an artifact directory (default: auto)")
+    bench = sub.add_parser('bench', help="check against brute force and time single-process vs sharded search")
+    bench.add_argument('--rows', type=int, default=1_000_000)
+    bench.add_argument('--out', default='/tmp/profile_index_bench')
+    bench.add_argument('--queries', type=int, default=64)
+    bench.add_argument('--workers', type=int, help="processes (default: all cores)")
+    bench.add_argument('--metric', choices=METRICS, default='jaccard')
+    bench.add_argument('--model')
+    args = parser.parse_args(argv)
+
+    bundle = load_bundle(args.model)
+    if args.cmd == 'build':
+        start = time.perf_counter()
+        index = build_index(args.data, bundle, args.out)
+        print(f"{len(index):,} profiles, {index.bits.shape[1]} words each ({index.bits.nbytes / 1e6:.1f} MB) "
+              f"-> {args.out}/ in {time.perf_counter() - start:.1f}s")
+        return
+
+    start = time.perf_counter()
+    index = synthetic_index(args.rows, bundle, args.out)
+    print(f"{len(index):,} synthetic profiles packed in {time.perf_counter() - start:.1f}s "
+          f"({index.bits.nbytes / 1e6:.1f} MB)")
+    profiles = read_profiles(DATA_PATH)[::max(1, 3600 // args.queries)][:args.queries]
+    queries = index.encode(profiles)
+    k = 10
+    sample = min(len(index), 100_000)
+    start = time.perf_counter()
+    ref_scores, ref_rows = brute_force(index.bits[:sample], queries, k, args.metric)
+    ref_time = time.perf_counter() - start
+    start = time.perf_counter()
+    scores, rows = search_bits(index.bits, index.counts, queries, k, args.metric, stop=sample,
+                               n_features=len(index.features))
+    bit_time = time.perf_counter() - start
+    same = np.array_equal(rows, ref_rows) and np.allclose(scores, ref_scores)
+    print(f"{sample:,} rows: bitset {bit_time * 1e3:.0f} ms, unpacked float matmul {ref_time * 1e3:.0f} ms, "
+          f"{'identical' if same else 'MISMATCH'} top-{k}")
+    if not same:
+        raise SystemExit(1)
+
+    start = time.perf_counter()
+    single = index.search(profiles, k, args.metric)
+    elapsed = time.perf_counter() - start
+    print(f"one process : {elapsed * 1e3:8.1f} ms for {len(profiles)} queries ({elapsed / len(profiles) * 1e3:.2f} ms each)")
+    with shard_pool(args.out, args.workers) as pool:
+        index.search(profiles[:1], k, args.metric, pool)  # start and warm the workers
+        start = time.perf_counter()
+        sharded = index.search(profiles, k, args.metric, pool)
+        elapsed = time.perf_counter() - start
+    print(f"sharded     : {elapsed * 1e3:8.1f} ms over {args.workers or os.cpu_count()} processes, "
+          f"{'same' if sharded == single else 'DIFFERENT'} results")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from features import CAT_FIELDS, MULTI_FIELDS  # noqa: E402
+
+INTERESTS = ['Art', 'Code', 'Data', 'Music']
+STRENGTHS = ['Logic', 'People', 'Writing']
+CAREERS = ['Analyst', 'Designer', 'Engineer', 'Musician', 'Writer']
+
+
+@pytest.fixture(scope='session')
+def tiny_bundle():
+    """A model.ipynb-style bundle: a small random forest over one-hot answer features."""
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
+
+    features = ([MULTI_FIELDS['interests'] + v for v in INTERESTS] + [MULTI_FIELDS['strengths'] + v for v in STRENGTHS]
+                + [f"{key}_{v}" for key in CAT_FIELDS for v in ('A', 'B')])
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 2, size=(400, len(features))).astype(np.float64)
+    y = rng.integers(0, len(CAREERS), size=400)
+    return {'model': RandomForestClassifier(n_estimators=10, max_depth=6, random_state=0).fit(X, y),
+            'le': LabelEncoder().fit(CAREERS), 'mlb_int': MultiLabelBinarizer().fit([INTERESTS]),
+            'mlb_str': MultiLabelBinarizer().fit([STRENGTHS]), 'features': features}
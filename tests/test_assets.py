@@ -0,0 +1,22 @@
+import os
+import shutil
+
+from assets import FONT_CSS, FONT_DIR, GOOGLE_FONTS_URL, STYLESHEET, head_html
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_google_fonts_stay_linked_until_fonts_are_self_hosted(tmp_path):
+    shutil.copy(os.path.join(ROOT, 'static', STYLESHEET), tmp_path)
+    html = head_html(True, str(tmp_path), 'app/static')
+    assert GOOGLE_FONTS_URL.replace('&', '&amp;') in html and f'app/static/{STYLESHEET}?v=' in html
+
+    os.makedirs(tmp_path / FONT_DIR)
+    (tmp_path / FONT_DIR / FONT_CSS).write_text("@font-face { font-family: 'Inter'; }\n")
+    html = head_html(True, str(tmp_path), 'app/static')
+    assert 'fonts.googleapis.com' not in html and f'app/static/{FONT_DIR}/{FONT_CSS}?v=' in html
+
+
+def test_inlined_stylesheet_imports_google_fonts():
+    html = head_html(False, os.path.join(ROOT, 'static'))
+    assert html.startswith('<style>') and GOOGLE_FONTS_URL in html
@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+from batching import MicroBatcher
+
+
+def echo(profiles):
+    return [profile * 10 for profile in profiles]
+
+
+def test_batches_resolve_every_caller():
+    batcher = MicroBatcher(echo, max_batch=8, max_delay=0.01)
+    futures = [batcher.submit(i) for i in range(20)]
+    assert [f.result(5) for f in futures] == [i * 10 for i in range(20)]
+    assert batcher.rank(3, timeout=5) == 30
+    batcher.close()
+    assert batcher.metrics.snapshot()['requests'] == 21
+
+
+def test_submit_after_close_raises_instead_of_hanging():
+    batcher = MicroBatcher(echo)
+    batcher.close()
+    batcher.close()  # e.g. on_release after an explicit close
+    with pytest.raises(RuntimeError, match='closed'):
+        batcher.submit(1)
+    with pytest.raises(RuntimeError, match='closed'):
+        batcher.rank(1, timeout=1)
+
+
+def test_close_scores_requests_queued_before_it():
+    release = threading.Event()
+
+    def slow(profiles):
+        release.wait(5)
+        return echo(profiles)
+
+    batcher = MicroBatcher(slow, max_batch=2, max_delay=0.001)
+    futures = [batcher.submit(i) for i in range(6)]
+    closer = threading.Thread(target=batcher.close)
+    closer.start()
+    release.set()
+    closer.join(5)
+    assert not closer.is_alive()
+    assert [f.result(0) for f in futures] == [i * 10 for i in range(6)]
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
+
+from artifact import load_artifact, save_artifact
+from forest import FlatForest, training_matrix
+from scoring import predict_proba
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL, DATA = os.path.join(ROOT, 'career_model.pkl'), os.path.join(ROOT, 'newdata.csv')
+
+
+@pytest.fixture(scope='module')
+def trained():
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 2, size=(300, 12)).astype(np.float64)
+    y = rng.integers(0, 5, size=300)
+    model = RandomForestClassifier(n_estimators=7, max_depth=6, random_state=0).fit(X, y)
+    return model, rng.integers(0, 2, size=(200, 12)).astype(np.float64)
+
+
+def test_flat_forest_matches_sklearn(trained):
+    model, X = trained
+    forest = FlatForest.from_model(model)
+    assert np.array_equal(forest.predict_proba(X), model.predict_proba(X))
+    assert np.array_equal(forest.predict(X), model.predict(X))
+
+
+def test_artifact_round_trip_matches_sklearn(trained, tmp_path):
+    model, X = trained
+    bundle = {'model': model, 'le': LabelEncoder().fit([f"career {i}" for i in range(5)]),
+              'mlb_int': MultiLabelBinarizer().fit([['a', 'b']]), 'mlb_str': MultiLabelBinarizer().fit([['c']]),
+              'features': [f"f{i}" for i in range(12)]}
+    meta = load_artifact(save_artifact(bundle, str(tmp_path / 'model')))
+    assert meta['le'].classes_.tolist() == bundle['le'].classes_.tolist()
+    assert np.array_equal(FlatForest.from_artifact(meta).predict_proba(X), model.predict_proba(X))
+
+
+@pytest.mark.skipif(not (os.path.exists(MODEL) and os.path.exists(DATA)),
+                    reason="needs the trained career_model.pkl and newdata.csv")
+def test_trained_model_parity_on_every_newdata_row(tmp_path):
+    import joblib
+    import pandas as pd
+
+    bundle = joblib.load(MODEL)
+    model = bundle['model']
+    df = pd.read_csv(DATA)
+    X = training_matrix(df, bundle).to_numpy(np.float32)
+    assert len(X) == len(df)
+    expected = predict_proba(model, X)
+    assert np.array_equal(FlatForest.from_model(model).predict_proba(X), expected)
+    meta = load_artifact(save_artifact(bundle, str(tmp_path / 'career_model')))
+    assert np.array_equal(FlatForest.from_artifact(meta).predict_proba(X), expected)
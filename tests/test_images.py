@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+pytest.importorskip('PIL')
+
+from content import ContentStore, slug  # noqa: E402
+from images import ICONS, THUMB_DIR, THUMB_SIZES, ImageIndex, main  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def built(tmp_path_factory):
+    """`images.py fixtures` then `images.py build --offline`, with one career's original removed."""
+    tmp = tmp_path_factory.mktemp('images')
+    src, out = str(tmp / 'sources'), str(tmp / 'static')
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(ROOT)  # content/ is read relative to the working directory
+        main(['fixtures', src])
+        careers = ContentStore().careers()
+        missing = careers[0]
+        os.remove(os.path.join(src, slug(missing) + '.jpg'))
+        main(['build', '--source-dir', src, '--out', out, '--offline'])
+    with open(os.path.join(out, THUMB_DIR, 'manifest.json'), encoding='utf-8') as f:
+        return out, json.load(f), careers, missing
+
+
+def test_offline_build_writes_content_hashed_webp(built):
+    from PIL import Image
+
+    out, manifest, careers, missing = built
+    assert set(manifest['careers']) == set(careers) - {missing}
+    assert set(manifest['icons']) == set(ICONS)
+    for career, sizes in manifest['careers'].items():
+        assert set(sizes) == {str(h) for h in THUMB_SIZES}
+        for height, rel in sizes.items():
+            path = os.path.join(out, rel)
+            with open(path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()[:10]
+            assert rel == f"{THUMB_DIR}/{slug(career)}-{height}-{digest}.webp"
+            with Image.open(path) as image:
+                assert image.format == 'WEBP' and image.size == THUMB_SIZES[int(height)]
+    assert sorted(os.listdir(os.path.join(out, THUMB_DIR))) == sorted(
+        ['manifest.json'] + [os.path.basename(rel) for sizes in manifest['careers'].values() for rel in sizes.values()]
+        + [os.path.basename(rel) for rel in manifest['icons'].values()])
+
+
+def test_image_index_lookups_and_placeholder(built):
+    out, manifest, careers, missing = built
+    index = ImageIndex(out, url_prefix='app/static')
+    career = next(iter(manifest['careers']))
+    assert index.url(career, 160) == f"app/static/{manifest['careers'][career]['160']}"
+    assert index.icon('sidebar-logo') == f"app/static/{manifest['icons']['sidebar-logo']}"
+    # No source image, an unknown career or size, and a thumbnail deleted after the build
+    assert index.url(missing, 160, remote='https://example.com/x.jpg') == index.placeholder
+    assert index.url('Astronaut', 160) == index.placeholder
+    assert index.url(career, 999) == index.placeholder
+    thumb = os.path.join(out, manifest['careers'][career]['280'])
+    os.rename(thumb, thumb + '.gone')
+    try:
+        assert ImageIndex(out).url(career, 280) == index.placeholder
+    finally:
+        os.rename(thumb + '.gone', thumb)
+
+
+def test_image_index_without_a_build_uses_remote_originals(tmp_path):
+    index = ImageIndex(str(tmp_path))
+    assert index.url('Data Scientist', 160, remote='https://example.com/x.jpg') == 'https://example.com/x.jpg'
+    assert index.url('Data Scientist', 160) == index.placeholder
+    assert index.icon('header-logo') == ICONS['header-logo'][0]
@@ -0,0 +1,35 @@
+import pytest
+
+from artifact import save_artifact
+from conftest import CAREERS
+from registry import ModelRegistry, ModelWatcher
+
+
+def test_watcher_swaps_in_versions_activated_after_it_started(tiny_bundle, tmp_path):
+    registry = ModelRegistry(str(tmp_path / 'models'))
+    watcher = ModelWatcher(registry, interval=0.01)
+    assert watcher.bundle is None and watcher.version is None
+
+    source = save_artifact(tiny_bundle, str(tmp_path / 'career_model'))
+    registry.publish(source, 'v1', activate=False)
+    assert not watcher.check() and watcher.bundle is None
+
+    registry.activate('v1')
+    assert watcher.check()
+    assert watcher.version == 'v1' and list(watcher.bundle['careers'].names) == CAREERS
+
+    registry.publish(source, 'v2')
+    assert watcher.check() and watcher.version == 'v2'
+    registry.rollback()
+    assert watcher.check() and watcher.version == 'v1'
+
+
+def test_watcher_refuses_to_start_on_a_broken_active_version(tiny_bundle, tmp_path):
+    registry = ModelRegistry(str(tmp_path / 'models'))
+    registry.publish(save_artifact(tiny_bundle, str(tmp_path / 'career_model')), 'v1')
+
+    def reject(bundle):
+        raise ValueError("no content")
+
+    with pytest.raises(ValueError, match='no content'):
+        ModelWatcher(registry, validate=reject)
@@ -0,0 +1,41 @@
+import os
+
+import numpy as np
+import pytest
+
+from artifact import save_artifact
+from conftest import CAREERS
+from scoring import boost_batch, boost_scores, load_bundle, predict_proba, rank_rows, top_k
+
+# Rows with equal probabilities: all tied, ties straddling the top-3 cut, ties inside it
+TIED = np.array([[0.2, 0.2, 0.2, 0.2, 0.2],
+                 [0.4, 0.2, 0.2, 0.2, 0.0],
+                 [0.0, 0.3, 0.3, 0.1, 0.3],
+                 [0.5, 0.0, 0.5, 0.0, 0.0],
+                 [0.0, 0.0, 0.0, 0.0, 1.0]])
+
+
+def test_load_bundle_picks_up_a_model_replaced_in_place(tiny_bundle, tmp_path):
+    path = str(tmp_path / 'career_model')
+    save_artifact(tiny_bundle, path)
+    first = load_bundle(path)
+    assert load_bundle(path) is first
+
+    save_artifact(tiny_bundle, path)
+    meta = os.path.join(path, 'meta.json')
+    os.utime(meta, ns=(os.stat(meta).st_atime_ns, os.stat(meta).st_mtime_ns + 1))  # within mtime granularity
+    second = load_bundle(path)
+    assert second is not first and second['version'] != first['version']
+    assert load_bundle(path) is second
+
+
+@pytest.mark.parametrize('k', [1, 3, len(CAREERS), len(CAREERS) + 2])
+def test_vectorized_ranking_matches_per_row_reference(tiny_bundle, k):
+    X = np.random.default_rng(1).integers(0, 2, size=(500, len(tiny_bundle['features']))).astype(np.float64)
+    probs = np.vstack([predict_proba(tiny_bundle['model'], X), TIED])
+    boosted = boost_batch(probs)
+    assert np.allclose(boosted, [boost_scores(row) for row in probs], rtol=0, atol=1e-12)
+    ranked, reference = top_k(boosted, k), rank_rows(probs, k)
+    assert ranked.shape == (len(probs), min(k, len(CAREERS)))
+    assert np.array_equal(ranked['id'], reference['id'])
+    assert np.array_equal(ranked['score'], reference['score'])
@@ -0,0 +1,450 @@
+import argparse
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
+
+from artifact import ARTIFACT_DIR, combine_forests, export_forest, is_artifact, load_artifact, save_artifact
+from careers import CareerRegistry
+from features import CAT_FIELDS, MULTI_FIELDS, FeatureEncoder
+from forest import FlatForest
+from ingest import CHUNK_ROWS, ColumnarDataset, Vocabulary, is_columnar, iter_encoded, scan_vocabulary, split_tokens
+from knowledge import KnowledgeBase
+from scoring import (MODEL_PATH, default_model_path, frame_profiles, load_bundle, model_version, predict_proba,
+                     split_list)
+from registry import REGISTRY_DIR, ModelRegistry
+from similarity import INDEX_DIR, ProfileIndex, n_words, pack, save_index, unpack
+
+log = logging.getLogger('pathwise.train')
+DATA_PATH = 'newdata.csv'
+STREAM_MODEL_PATH = 'career_model_stream.pkl'  # never the served career_model.pkl
+
+
+@contextmanager
+def stage(name, timings):
+    start = time.perf_counter()
+    yield
+    timings[name] = time.perf_counter() - start
+    log.info("%-9s %8.2fs", name, timings[name])
+
+
+# --- 1. LOAD & ENCODE (same steps as model.ipynb) ---
+def load_data(path):
+    if is_columnar(path):
+        return ColumnarDataset(path)
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def encode(df):
+    """One-hot the training frame; returns X (float32), y and the fitted encoders."""
+    if isinstance(df, ColumnarDataset):
+        # Already encoded on disk: unpack the bit columns, no string parsing
+        return df.matrix(), df.labels(), df.vocab.encoders()
+    mlb_int = MultiLabelBinarizer()
+    int_enc = mlb_int.fit_transform(df['interests'].apply(split_list))
+    mlb_str = MultiLabelBinarizer()
+    str_enc = mlb_str.fit_transform(df['strengths'].apply(split_list))
+    df_cat = pd.get_dummies(df[CAT_FIELDS])
+
+    le = LabelEncoder()
+    y = le.fit_transform(df['career'])
+    features = (df_cat.columns.tolist() + [f"int_{c}" for c in mlb_int.classes_]
+                + [f"str_{c}" for c in mlb_str.classes_])
+    X = np.hstack([df_cat.to_numpy(np.float32), int_enc.astype(np.float32), str_enc.astype(np.float32)])
+    return X, y, {'le': le, 'mlb_int': mlb_int, 'mlb_str': mlb_str, 'features': features}
+
+
+# --- 2. FIT & EVALUATE ---
+def fit(X_train, y_train, params, n_jobs=-1, seed=42):
+    model = RandomForestClassifier(random_state=seed, n_jobs=n_jobs, **params)
+    return model.fit(X_train, y_train)
+
+
+def evaluate(model, X_test, y_test):
+    return accuracy_score(y_test, model.predict(X_test))
+
+
+def _sweep_job(X_train, X_test, y_train, y_test, params, seed):
+    start = time.perf_counter()
+    model = fit(X_train, y_train, params, n_jobs=1, seed=seed)
+    return params, evaluate(model, X_test, y_test), time.perf_counter() - start
+
+
+def sweep(X_train, X_test, y_train, y_test, grid, seed=42, workers=None):
+    """Fit every grid point in its own process; returns (params, accuracy, seconds) best first."""
+    keys = list(grid)
+    points = [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+    with ProcessPoolExecutor(workers) as pool:
+        jobs = [pool.submit(_sweep_job, X_train, X_test, y_train, y_test, p, seed) for p in points]
+        results = [job.result() for job in jobs]
+    for params, acc, secs in results:
+        log.info("sweep     %s -> accuracy %.4f (%.2fs)", params, acc, secs)
+    return sorted(results, key=lambda r: (-r[1], r[2]))
+
+
+def parse_grid(specs):
+    """['n_estimators=50,100', 'max_depth=none,20'] -> {'n_estimators': [50, 100], 'max_depth': [None, 20]}"""
+    def value(v):
+        if v.lower() == 'none':
+            return None
+        for cast in (int, float):
+            try:
+                return cast(v)
+            except ValueError:
+                pass
+        return v
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        grid[name] = [value(v) for v in values.split(',')]
+    return grid
+
+
+# --- 3. PIPELINE ---
+def train(data=DATA_PATH, out=MODEL_PATH, artifact=ARTIFACT_DIR, params=None, grid=None,
+          test_size=0.2, seed=42, n_jobs=-1, workers=None):
+    timings = {}
+    with stage('load', timings):
+        df = load_data(data)
+    with stage('encode', timings):
+        X, y, encoders = encode(df)
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=seed)
+    params = dict(params or {})
+    if grid:
+        with stage('sweep', timings):
+            best_params, _, _ = sweep(X_train, X_test, y_train, y_test, grid, seed, workers)[0]
+        params.update(best_params)
+    with stage('fit', timings):
+        model = fit(X_train, y_train, params, n_jobs, seed)
+    with stage('evaluate', timings):
+        accuracy = evaluate(model, X_test, y_test)
+    log.info("accuracy  %.4f on %d held-out rows (%s)", accuracy, len(y_test), params)
+    with stage('dump', timings):
+        bundle = dict(encoders, model=model)
+        joblib.dump(bundle, out)
+        if artifact:
+            save_artifact(bundle, artifact)
+    return bundle, accuracy, timings
+
+
+# --- 4. STREAMING (out-of-core) PIPELINE ---
+def make_incremental_learner(name, seed=42):
+    from sklearn.linear_model import SGDClassifier
+    from sklearn.naive_bayes import BernoulliNB
+    if name == 'sgd':
+        # Needs shuffled input: exports sorted by career make SGD forget earlier classes
+        return SGDClassifier(loss='log_loss', alpha=1e-5, random_state=seed)
+    # Count-based, so the result does not depend on row order or chunk boundaries
+    return BernoulliNB()
+
+
+def train_streaming(data=DATA_PATH, out=STREAM_MODEL_PATH, learner='nb', chunksize=CHUNK_ROWS, vocab_from=None,
+                    test_every=5, max_holdout=100_000, seed=42):
+    """Fit an incremental learner chunk by chunk; memory is bounded by `chunksize`, not the file.
+
+    Every `test_every`-th row is held out for evaluation until `max_holdout` rows are kept.
+    """
+    from scipy.sparse import vstack
+
+    timings = {}
+    columnar = ColumnarDataset(data) if is_columnar(data) else None
+    if columnar and vocab_from:
+        raise ValueError("--vocab-from only applies to CSV input; a columnar dataset carries its own vocabulary")
+    with stage('scan', timings):
+        if vocab_from:
+            vocab = Vocabulary.from_bundle(joblib.load(vocab_from))
+        else:
+            vocab = columnar.vocab if columnar else scan_vocabulary(data, chunksize)
+    log.info("vocab     %d careers, %d features", len(vocab.careers), len(vocab.features))
+
+    model = make_incremental_learner(learner, seed)
+    classes = np.arange(len(vocab.careers))
+    holdout_X, holdout_y, kept, offset = [], [], 0, 0
+    with stage('fit', timings):
+        chunks = columnar.iter_encoded(chunksize) if columnar else iter_encoded(data, vocab, chunksize)
+        for i, (X, y) in enumerate(chunks):
+            test = (np.arange(offset, offset + len(y)) % test_every == 0) if test_every else np.zeros(len(y), bool)
+            test &= np.cumsum(test) <= max_holdout - kept
+            offset += len(y)
+            if test.any():
+                holdout_X.append(X[test])
+                holdout_y.append(y[test])
+                kept += int(test.sum())
+            model.partial_fit(X[~test], y[~test], classes=classes)
+            log.info("chunk %-4d %d rows", i, len(y))
+    with stage('evaluate', timings):
+        accuracy = evaluate(model, vstack(holdout_X), np.concatenate(holdout_y)) if kept else float('nan')
+    log.info("accuracy  %.4f on %d held-out rows (%s)", accuracy, kept, type(model).__name__)
+    with stage('dump', timings):
+        bundle = dict(vocab.encoders(), model=model)
+        joblib.dump(bundle, out)
+    return bundle, accuracy, timings
+
+
+# --- 5. INCREMENTAL UPDATE (new rows, a few new trees) ---
+ENCODERS = {'interests': 'mlb_int', 'strengths': 'mlb_str'}
+REFIT_TREES = 10
+
+
+def grow_vocabulary(bundle, df):
+    """The bundle's encoders with answers and careers first seen in `df` appended.
+
+    Existing feature columns and career ids keep their positions, so the current trees and
+    the packed history stay valid without re-encoding. The class order is then no longer
+    sorted, which load_bundle and CareerRegistry do not need.
+    """
+    features = list(bundle['features'])
+    known = set(features)
+    for key in CAT_FIELDS:
+        features += [f"{key}_{v}" for v in sorted(df[key].dropna().astype(str).unique()) if f"{key}_{v}" not in known]
+    grown = {}
+    for key, prefix in MULTI_FIELDS.items():
+        values = bundle[ENCODERS[key]].classes_.tolist()
+        added = sorted(set(split_tokens(df[key])) - set(values))
+        features += [f"{prefix}{v}" for v in added]
+        grown[ENCODERS[key]] = MultiLabelBinarizer(classes=values + added).fit([])
+    classes = bundle['le'].classes_.tolist()
+    le = LabelEncoder()
+    le.classes_ = np.array(classes + sorted(set(df['career'].dropna()) - set(classes)), dtype=object)
+    return dict(grown, le=le, features=features)
+
+
+def load_forest(path, bundle):
+    """(node arrays, max depth, version, fitting version of each tree, history store) of a pickle or artifact."""
+    if is_artifact(path):
+        meta = load_artifact(path)
+        version = meta.get('version', 1)
+        return (meta['arrays'], meta['max_depth'], version, meta.get('tree_versions', [version] * meta['n_trees']),
+                meta.get('history', INDEX_DIR))
+    arrays, depth = export_forest(bundle['model'])
+    return arrays, depth, 1, [1] * len(arrays['roots']), INDEX_DIR
+
+
+def versioned(path, version):
+    # career_model -> career_model.v3; an earlier version's suffix is replaced, not stacked
+    stem, dot, suffix = os.path.normpath(path).rpartition('.v')
+    return f"{stem if dot and suffix.isdigit() else os.path.normpath(path)}.v{version}"
+
+
+def content_problem(encoders):
+    """Why the app and server would refuse to start on these careers, or None."""
+    try:
+        KnowledgeBase(CareerRegistry(encoders['le'].classes_))
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def load_history(path, bundle, base_data):
+    """Packed rows behind the current forest (the similarity store); packed once from `base_data` if missing."""
+    if os.path.isdir(path):
+        index = ProfileIndex.load(path)
+        if index.features == list(bundle['features']) and index.names.names == bundle['careers'].names:
+            return index, False
+    return ProfileIndex.from_csv([base_data], bundle), True
+
+
+def grow_history(index, encoders, bits, careers):
+    """Append new packed rows; old rows only gain zero words if the feature count crossed a word boundary."""
+    old = np.asarray(index.bits)
+    pad = n_words(len(encoders['features'])) - old.shape[1]
+    if pad > 0:
+        old = np.hstack([old, np.zeros((len(old), pad), dtype=old.dtype)])
+    return ProfileIndex(np.vstack([old, bits]), np.concatenate([index.careers, careers]), encoders['features'],
+                        encoders['le'].classes_)
+
+
+def full_retrain(base_data, train_df, test_df, params, n_jobs, seed):
+    """Baseline for the report: the model.ipynb pipeline over the whole history; (accuracy, timings)."""
+    import tempfile
+    timings = {}
+    with stage('load', timings):
+        df = pd.concat([load_data(base_data), train_df], ignore_index=True)
+    with stage('encode', timings):
+        X, y, encoders = encode(df)
+    with stage('fit', timings):
+        model = fit(X, y, params, n_jobs, seed)
+    with stage('dump', timings), tempfile.TemporaryDirectory() as tmp:
+        bundle = dict(encoders, model=model)
+        joblib.dump(bundle, os.path.join(tmp, 'model.pkl'))
+        save_artifact(bundle, os.path.join(tmp, 'artifact'))
+    X_test = FeatureEncoder(encoders['features']).encode_batch(frame_profiles(test_df))
+    predicted = encoders['le'].classes_[model.predict(X_test)]
+    return float(np.mean(predicted == test_df['career'].to_numpy())), timings
+
+
+def train_incremental(new_data, base=None, out=None, history=None, base_data=DATA_PATH, refit=None, add=False,
+                      max_depth=None, test_size=0.2, seed=42, n_jobs=-1, compare=False, publish=None):
+    """Fold newly labelled rows into an existing forest by fitting only `refit` new trees.
+
+    Only the new rows are encoded. The history (see load_history) grows by appending them, and
+    the new trees are fitted on all of it; they replace the `refit` oldest trees, or join the
+    forest with `add`. Old trees give careers they never saw no votes, so by default an update
+    that adds careers refits half the forest instead of REFIT_TREES.
+
+    The result is a new artifact directory (default career_model.v<N>) with its own history
+    store (profile_index.v<N>); the base model and its history are left as they are, so the
+    serving model only changes when the new version is published. With `publish` (a registry
+    directory) it is added to the registry and activated only if every career has content.
+    A `test_size` share of the new rows is held out of fitting to score the update.
+    Returns (info dict, timings); with `compare` info also has the full-retrain baseline.
+    """
+    timings = {}
+    base = base or default_model_path()
+    with stage('load', timings):
+        bundle = load_bundle(base)
+        arrays, depth, version, tree_versions, base_history = load_forest(base, bundle)
+        df = pd.read_csv(new_data, dtype=str).dropna(subset=['career'])
+    history = history or base_history
+    out = out or versioned(ARTIFACT_DIR, version + 1)
+    history_out = versioned(INDEX_DIR, version + 1)
+    for path in (out, history_out):
+        if os.path.exists(path):
+            raise ValueError(f"{path} already exists; pass another --artifact or remove it")
+    with stage('history', timings):
+        index, bootstrapped = load_history(history, bundle, base_data)
+    with stage('encode', timings):
+        encoders = grow_vocabulary(bundle, df)
+        n_features = len(encoders['features'])
+        bits = pack(FeatureEncoder(encoders['features']).encode_batch(frame_profiles(df)), n_features)
+        careers = df['career'].map({c: i for i, c in enumerate(encoders['le'].classes_)}).to_numpy(np.int16)
+        test = np.random.default_rng(seed).random(len(df)) < test_size
+        index = grow_history(index, encoders, bits, careers)
+    if refit is None:
+        new_careers = len(encoders['le'].classes_) > len(bundle['careers'].names)
+        refit = max(REFIT_TREES, len(tree_versions) // 2) if new_careers else REFIT_TREES
+    with stage('fit', timings):
+        # Everything but this round's held-out rows; labelless (-1) rows only serve similarity search
+        fit_rows = np.flatnonzero(np.concatenate([np.zeros(len(index) - len(df), bool), test]) == 0)
+        fit_rows = fit_rows[np.asarray(index.careers)[fit_rows] >= 0]
+        X = unpack(np.asarray(index.bits)[fit_rows], n_features)
+        model = fit(X, np.asarray(index.careers)[fit_rows], {'n_estimators': refit, 'max_depth': max_depth},
+                    n_jobs, seed + version)
+    with stage('merge', timings):
+        new_arrays, new_depth = export_forest(model)
+        n_old = len(tree_versions)
+        keep = sorted(range(n_old) if add else np.argsort(tree_versions, kind='stable')[min(refit, n_old):])
+        n_classes = len(encoders['le'].classes_)
+        arrays = combine_forests([(arrays, np.arange(len(bundle['careers'].names)), keep),
+                                  (new_arrays, model.classes_, range(refit))], n_classes)
+        depth = max(depth, new_depth)
+        tree_versions = [tree_versions[t] for t in keep] + [version + 1] * refit
+    with stage('evaluate', timings):
+        X_test = unpack(bits[test], n_features)
+        predicted = FlatForest(arrays, depth).predict(X_test)
+        # The old forest reads only the old columns; new careers are beyond its classes
+        previous = predict_proba(bundle['model'], X_test[:, :len(bundle['features'])]).argmax(axis=1)
+        accuracy, before = (float(np.mean(p == careers[test])) if test.any() else float('nan')
+                            for p in (predicted, previous))
+    with stage('dump', timings):
+        # Written beside the base under temporary names and renamed into place once complete
+        tmp = f"{os.path.normpath(out)}.tmp-{os.getpid()}"
+        save_artifact(encoders, tmp, forest=(arrays, depth), version=version + 1, parent=bundle['version'],
+                      tree_versions=tree_versions, history=history_out)
+        os.rename(tmp, out)
+        tmp = f"{history_out}.tmp-{os.getpid()}"
+        save_index(index, tmp, model_version(out), [history if not bootstrapped else base_data, new_data])
+        os.rename(tmp, history_out)
+    problem = content_problem(encoders)
+    info = {'version': version + 1, 'rows': len(df), 'history': len(index), 'bootstrapped': bootstrapped,
+            'trees': len(tree_versions), 'refit': refit, 'held_out': int(test.sum()), 'accuracy': accuracy,
+            'accuracy_before': before, 'features_added': n_features - len(bundle['features']),
+            'careers_added': encoders['le'].classes_[len(bundle['careers'].names):].tolist(), 'out': out,
+            'history_out': history_out, 'content_problem': problem, 'published': None}
+    if publish:
+        # Registered either way, but never activated (served) while a career lacks content
+        info['published'] = ModelRegistry(publish).publish(out, activate=problem is None,
+                                                            note=f"update {version + 1} from {new_data}")
+    log.info("accuracy  %.4f on %d held-out new rows (%.4f before the update)", accuracy, info['held_out'], before)
+    if compare:
+        params = {'n_estimators': len(tree_versions), 'max_depth': max_depth}
+        info['full_accuracy'], info['full_timings'] = full_retrain(base_data, df[~test], df[test], params, n_jobs,
+                                                                   seed)
+    return info, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the career model (scripted model.ipynb).")
+    parser.add_argument('--data', default=DATA_PATH, help="CSV, Parquet or columnar dataset directory")
+    parser.add_argument('--out', help=f"pickle to write (default: {MODEL_PATH}, or {STREAM_MODEL_PATH} with --streaming)")
+    parser.add_argument('--artifact', help="flat-array artifact dir (default: career_model/, or career_model.v<N>/ "
+                                           "for --update; '' to skip)")
+    parser.add_argument('--trees', type=int, default=100)
+    parser.add_argument('--max-depth', type=int)
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--jobs', type=int, default=-1, help="cores for tree fitting (default: all)")
+    parser.add_argument('--sweep', action='append', default=[], metavar='PARAM=V1,V2',
+                        help="hyperparameter grid axis, repeatable; the best point is refitted")
+    parser.add_argument('--workers', type=int, help="processes for the sweep (default: all cores)")
+    parser.add_argument('--streaming', action='store_true',
+                        help="read the CSV in chunks and fit an incremental learner (bounded memory)")
+    parser.add_argument('--chunksize', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--learner', choices=['nb', 'sgd'], default='nb',
+                        help="streaming learner: Bernoulli naive Bayes or logistic SGD (needs shuffled rows)")
+    parser.add_argument('--vocab-from', help="reuse the vocabulary of an existing bundle instead of a scan pass")
+    parser.add_argument('--update', metavar='NEW_CSV',
+                        help="incremental mode: fold these labelled rows into the current model as a new version")
+    parser.add_argument('--base', help="model to update (default: the one the app loads)")
+    parser.add_argument('--history',
+                        help="packed rows behind the base model (default: the one it records, else profile_index/; "
+                             "built from --data if missing)")
+    parser.add_argument('--refit', type=int,
+                        help=f"trees fitted by an update (default: {REFIT_TREES}, half the forest if careers are new)")
+    parser.add_argument('--add', action='store_true', help="add the new trees instead of replacing the oldest")
+    parser.add_argument('--compare', action='store_true', help="also time a full retrain on the same rows")
+    parser.add_argument('--publish', nargs='?', const=REGISTRY_DIR, metavar='REGISTRY',
+                        help="add the update to the model registry; activated only if every career has content")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    if args.update:
+        info, timings = train_incremental(args.update, args.base, args.artifact, args.history, args.data, args.refit,
+                                          args.add, args.max_depth, args.test_size, args.seed, args.jobs, args.compare,
+                                          args.publish)
+        total = sum(timings.values()) - (timings['history'] if info['bootstrapped'] else 0)
+        log.info("version   %d: %d new rows, history %d rows, %d of %d trees refitted, +%d features, "
+                 "new careers: %s",
+                 info['version'], info['rows'], info['history'], info['refit'], info['trees'],
+                 info['features_added'], ', '.join(info['careers_added']) or 'none')
+        if info['bootstrapped']:
+            log.info("history   packed once from %s in %.2fs (not counted below)", args.data, timings['history'])
+        log.info("total     %8.2fs -> %s (history %s)", total, os.path.abspath(info['out']), info['history_out'])
+        if info['published']:
+            log.info("registry  %s %s", info['published'],
+                     'activated' if not info['content_problem'] else 'registered, NOT activated')
+        if args.compare:
+            full = sum(info['full_timings'].values())
+            log.info("full      %8.2fs retrain of %d trees, accuracy %.4f on the same rows -> update is %.1fx faster "
+                     "(%.2fs saved)", full, info['trees'], info['full_accuracy'], full / total, full - total)
+        if info['content_problem']:
+            # The app and server refuse to start on this version until content/ covers it (knowledge.py)
+            log.error("not servable: %s", info['content_problem'])
+            raise SystemExit(1)
+        return
+    args.out = args.out or (STREAM_MODEL_PATH if args.streaming else MODEL_PATH)
+    if args.streaming:
+        _, _, timings = train_streaming(args.data, args.out, args.learner, args.chunksize, args.vocab_from,
+                                         seed=args.seed)
+    else:
+        params = {'n_estimators': args.trees, 'max_depth': args.max_depth}
+        artifact = ARTIFACT_DIR if args.artifact is None else args.artifact
+        _, _, timings = train(args.data, args.out, artifact, params, parse_grid(args.sweep),
+                              args.test_size, args.seed, args.jobs, args.workers)
+    log.info("total     %8.2fs -> %s", sum(timings.values()), os.path.abspath(args.out))
+
+
+if __name__ == '__main__':
+    main()